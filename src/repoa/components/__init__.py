@@ -1,76 +1,105 @@
-"""REPOA Components - Core message, response, tool, model, and network handling."""
+"""REPOA Components - Core message, response, tool, model, and network handling.
 
-from .message_handler import (
-    BaseMessage,
-    UserMessage,
-    AssistantMessage,
-    SystemMessage,
-    ToolMessage,
-    TextMessage,
-    Message,
-)
-from .response_handler import (
-    ChatResponse,
-    ChatResponseChoice,
-    StreamResponse,
-    StreamingChoice,
-    TokenUsage,
-)
-from .tool_handler import (
-    ToolDefinition,
-    ToolInvocation,
-    ToolChoice,
-)
-from .model_handler import (
-    ModelSpec,
-    ProviderInfo,
-    ProviderPreferences,
-    ModelPricing,
-)
-from repoa.components.network_handler import (
-    WorkflowNetwork,
-    CompiledWorkflow,
-    Node,
-    Edge,
-    NetworkState,
-    ExecutionEngine,
-    ExecutionResult,
-    START,
-    END,
-)
+Exports are resolved lazily (PEP 562): importing this package does not
+build every pydantic schema, only the ones for names actually used.
 
-__all__ = [
+For bulk message (de)serialization prefer the cached adapters exported by
+the message handler (``parse_messages``/``dump_messages``) over repeated
+per-message ``model_validate`` calls; they resolve the discriminated
+Message union once on first use.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .message_handler import (
+        BaseMessage,
+        UserMessage,
+        AssistantMessage,
+        SystemMessage,
+        ToolMessage,
+        TextMessage,
+        Message,
+        dumps_message,
+        loads_message,
+    )
+    from .response_handler import (
+        ChatResponse,
+        ChatResponseChoice,
+        StreamResponse,
+        StreamingChoice,
+        TokenUsage,
+    )
+    from .tool_handler import (
+        ToolDefinition,
+        ToolInvocation,
+        ToolChoice,
+    )
+    from .model_handler import (
+        ModelSpec,
+        ProviderInfo,
+        ProviderPreferences,
+        ModelPricing,
+    )
+    from .network_handler import (
+        WorkflowNetwork,
+        CompiledWorkflow,
+        Node,
+        Edge,
+        NetworkState,
+        ExecutionEngine,
+        ExecutionResult,
+        START,
+        END,
+    )
+
+# Exported name -> defining subpackage, resolved lazily on first access.
+_EXPORTS = {
     # Message types
-    "BaseMessage",
-    "UserMessage",
-    "AssistantMessage",
-    "SystemMessage",
-    "ToolMessage",
-    "TextMessage",
-    "Message",
+    "BaseMessage": ".message_handler",
+    "UserMessage": ".message_handler",
+    "AssistantMessage": ".message_handler",
+    "SystemMessage": ".message_handler",
+    "ToolMessage": ".message_handler",
+    "TextMessage": ".message_handler",
+    "Message": ".message_handler",
+    "dumps_message": ".message_handler",
+    "loads_message": ".message_handler",
     # Response types
-    "ChatResponse",
-    "ChatResponseChoice",
-    "StreamResponse",
-    "StreamingChoice",
-    "TokenUsage",
+    "ChatResponse": ".response_handler",
+    "ChatResponseChoice": ".response_handler",
+    "StreamResponse": ".response_handler",
+    "StreamingChoice": ".response_handler",
+    "TokenUsage": ".response_handler",
     # Tool types
-    "ToolDefinition",
-    "ToolInvocation",
-    "ToolChoice",
+    "ToolDefinition": ".tool_handler",
+    "ToolInvocation": ".tool_handler",
+    "ToolChoice": ".tool_handler",
     # Model types
-    "ModelSpec",
-    "ProviderInfo",
-    "ProviderPreferences",
-    "ModelPricing",
+    "ModelSpec": ".model_handler",
+    "ProviderInfo": ".model_handler",
+    "ProviderPreferences": ".model_handler",
+    "ModelPricing": ".model_handler",
     # Network types
-    "WorkflowNetwork",
-    "CompiledWorkflow",
-    "Node",
-    "Edge",
-    "NetworkState",
-    "ExecutionEngine",
-    "ExecutionResult",
-    "START",
-    "END",
-]
+    "WorkflowNetwork": ".network_handler",
+    "CompiledWorkflow": ".network_handler",
+    "Node": ".network_handler",
+    "Edge": ".network_handler",
+    "NetworkState": ".network_handler",
+    "ExecutionEngine": ".network_handler",
+    "ExecutionResult": ".network_handler",
+    "START": ".network_handler",
+    "END": ".network_handler",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Resolve exported names lazily from their defining subpackages."""
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_name, __name__), name)
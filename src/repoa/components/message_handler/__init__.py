@@ -1,20 +1,65 @@
 """Message Handler module for REPOA framework."""
 
-from .base_types import BaseMessage, ContentBlock
-from .text_message import TextMessage
-from .user_message import UserMessage
-from .assistant_message import AssistantMessage
-from .system_message import SystemMessage
-from .tool_message import ToolMessage
-from .message import Message
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-__all__ = [
-    "BaseMessage",
-    "ContentBlock",
-    "TextMessage",
-    "UserMessage",
-    "AssistantMessage",
-    "SystemMessage",
-    "ToolMessage",
-    "Message",
-]
+if TYPE_CHECKING:
+    from .base_types import BaseMessage, ContentBlock
+    from .text_message import TextMessage
+    from .user_message import UserMessage
+    from .assistant_message import AssistantMessage
+    from .system_message import SystemMessage, get_system_message
+    from .tool_message import ToolMessage
+    from .message import (
+        Message,
+        parse_message,
+        parse_messages,
+        dump_message,
+        dump_messages,
+    )
+    from .message_pool import MessagePool, default_message_pool
+    from .message_codec import (
+        encode_message,
+        encode_messages,
+        decode_message_dict,
+        decode_message_dicts,
+        dumps_message,
+        loads_message,
+    )
+
+# Exported name -> defining submodule, resolved lazily (PEP 562) so that
+# importing the package does not build every pydantic schema up front.
+_EXPORTS = {
+    "BaseMessage": ".base_types",
+    "ContentBlock": ".base_types",
+    "TextMessage": ".text_message",
+    "UserMessage": ".user_message",
+    "AssistantMessage": ".assistant_message",
+    "SystemMessage": ".system_message",
+    "get_system_message": ".system_message",
+    "ToolMessage": ".tool_message",
+    "Message": ".message",
+    "parse_message": ".message",
+    "parse_messages": ".message",
+    "dump_message": ".message",
+    "dump_messages": ".message",
+    "MessagePool": ".message_pool",
+    "default_message_pool": ".message_pool",
+    "encode_message": ".message_codec",
+    "encode_messages": ".message_codec",
+    "decode_message_dict": ".message_codec",
+    "decode_message_dicts": ".message_codec",
+    "dumps_message": ".message_codec",
+    "loads_message": ".message_codec",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Resolve exported names lazily from their defining submodules."""
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_name, __name__), name)
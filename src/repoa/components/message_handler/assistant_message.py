@@ -1,15 +1,17 @@
 """Assistant message type."""
 
 from __future__ import annotations
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from typing import Iterable, List, Literal, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from typing_extensions import TypedDict, NotRequired
 from .base_types import BaseMessage
 
 
 class ToolInvocation(BaseModel):
     """Represents a tool/function invocation."""
-    
+
+    model_config = ConfigDict(extra="forbid")
+
     invocation_id: str
     tool_name: str
     parameters: dict
@@ -27,29 +29,65 @@ class AssistantMessageTypedDict(TypedDict):
 
 class AssistantMessage(BaseMessage):
     """Represents a message from an assistant/model."""
-    
-    agent: str = "assistant"
+
+    __msg_tag__ = "assistant"
+
+    agent: Literal["assistant"] = "assistant"
     response: str = Field(default="")
     tokens_used: Optional[int] = None
-    tool_invocations: List[ToolInvocation] = Field(default_factory=list)
+    # Tuple with a shared empty default: the common no-tools case costs
+    # no allocation, unlike a fresh list per instance.
+    tool_invocations: Tuple[ToolInvocation, ...] = ()
     stop_reason: Optional[str] = None
-    
-    def __init__(
-        self,
+
+    @model_validator(mode="before")
+    @classmethod
+    def _mirror_response_into_content(cls, data):
+        """Default content to the response text in a single validation pass."""
+        if isinstance(data, dict) and "content" not in data:
+            # Copy: the dict is the caller's own object on
+            # model_validate/parse_message paths
+            data = {**data, "content": data.get("response", "")}
+        return data
+
+    def add_tool_invocation(self, invocation: ToolInvocation) -> None:
+        """
+        Append a tool invocation.
+
+        Rebuilds the tuple, so appending is O(n); decode paths that
+        already hold every invocation should construct through
+        with_tool_invocations instead of appending one at a time.
+
+        Args:
+            invocation: Invocation to record
+        """
+        self.tool_invocations = (*self.tool_invocations, invocation)
+
+    @classmethod
+    def with_tool_invocations(
+        cls,
         response: str,
-        agent: str = "assistant",
-        tokens_used: Optional[int] = None,
-        tool_invocations: Optional[List[ToolInvocation]] = None,
-        stop_reason: Optional[str] = None,
-        **kwargs
-    ):
-        """Initialize assistant message."""
-        super().__init__(
-            content=response,
-            agent=agent,
+        invocations: Iterable[ToolInvocation],
+        **kwargs,
+    ) -> AssistantMessage:
+        """
+        Construct with the full set of tool invocations in one pass.
+
+        Built via model_construct for decode paths where the provider
+        already reports every invocation: the tuple is materialized
+        once, instead of growing through per-append rebuilds.
+
+        Args:
+            response: Response text (mirrored into content)
+            invocations: The invocations, already validated
+            **kwargs: Additional pre-validated field values
+
+        Returns:
+            Constructed AssistantMessage
+        """
+        return cls.model_construct(
             response=response,
-            tokens_used=tokens_used,
-            tool_invocations=tool_invocations or [],
-            stop_reason=stop_reason,
-            **kwargs
+            content=response,
+            tool_invocations=tuple(invocations),
+            **kwargs,
         )
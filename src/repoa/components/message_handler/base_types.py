@@ -1,8 +1,8 @@
 """Base types and models for message handling."""
 
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, Union, Literal
-from pydantic import BaseModel, Field
+from typing import Annotated, Any, ClassVar, Dict, List, Optional, Union, Literal
+from pydantic import BaseModel, ConfigDict, Field
 from typing_extensions import TypedDict, NotRequired
 
 
@@ -14,9 +14,11 @@ class ContentBlockTypedDict(TypedDict):
 
 class ContentBlock(BaseModel):
     """Represents a content block in a message."""
-    
+
+    model_config = ConfigDict(extra="forbid")
+
     text: Optional[str] = None
-    data_type: str = "text"
+    data_type: Literal["text", "image", "audio"] = "text"
 
 
 class BaseMessageTypedDict(TypedDict):
@@ -30,10 +32,22 @@ class BaseMessageTypedDict(TypedDict):
 class BaseMessage(BaseModel):
     """Base class for all message types."""
     
-    content: Union[str, List[ContentBlock]]
+    # No declared field needs arbitrary types; keeping assignment and
+    # instance revalidation off lets pydantic use its fast core
+    # validators, including when messages nest inside other models.
+    model_config = ConfigDict(
+        extra="forbid",
+        validate_assignment=False,
+        revalidate_instances="never",
+    )
+
+    __msg_tag__: ClassVar[str] = "text"
+
+    # str payloads dominate, so resolve the union left-to-right instead
+    # of letting smart-union speculatively try (and error out of) the
+    # list branch on every validation.
+    content: Annotated[
+        Union[str, List[ContentBlock]], Field(union_mode="left_to_right")
+    ]
     metadata: Optional[Dict[str, Any]] = None
     msg_id: Optional[str] = None
-    
-    class Config:
-        """Pydantic config."""
-        arbitrary_types_allowed = True
@@ -1,8 +1,9 @@
 """Discriminated union of all message types."""
 
 from __future__ import annotations
-from typing import Union, Annotated
-from pydantic import Discriminator, Tag
+from functools import lru_cache
+from typing import Any, List, Union, Annotated
+from pydantic import Discriminator, Tag, TypeAdapter
 from typing_extensions import TypeAliasType
 
 from .system_message import SystemMessage, SystemMessageTypedDict
@@ -12,20 +13,30 @@ from .tool_message import ToolMessage, ToolMessageTypedDict
 from .text_message import TextMessage, TextMessageTypedDict
 
 
-def get_message_type(msg_data: dict) -> str:
-    """Extract message type from discriminator field."""
+# Precompiled (field, tag) pairs for raw dict payloads, ordered by
+# discriminating power. Each field only ever appears on one message type
+# (the role fields are Literal-typed), so key presence alone decides.
+_DICT_TAG_MAP = (
+    ("agent", "assistant"),
+    ("sender", "user"),
+    ("instructions", "system"),
+    ("handler", "tool"),
+    ("tool_call_id", "tool"),
+    ("response", "assistant"),
+)
+
+
+def get_message_type(msg_data) -> str:
+    """Extract message type from the class tag or discriminator field."""
+    # Message instances carry a precomputed class-level tag; reading it
+    # avoids a full model_dump() just to inspect one field.
+    tag = getattr(msg_data, "__msg_tag__", None)
+    if tag is not None:
+        return tag
     if isinstance(msg_data, dict):
-        # Try different discriminator fields
-        if "agent" in msg_data and msg_data["agent"] == "assistant":
-            return "assistant"
-        elif "sender" in msg_data and msg_data["sender"] == "user":
-            return "user"
-        elif "instructions" in msg_data:
-            return "system"
-        elif "handler" in msg_data and msg_data["handler"] == "tool":
-            return "tool"
-        elif "response" in msg_data:
-            return "assistant"
+        for key, dict_tag in _DICT_TAG_MAP:
+            if key in msg_data:
+                return dict_tag
     return "text"
 
 
@@ -50,5 +61,39 @@ Message = Annotated[
         Annotated[ToolMessage, Tag("tool")],
         Annotated[TextMessage, Tag("text")],
     ],
-    Discriminator(lambda m: get_message_type(m.model_dump() if hasattr(m, "model_dump") else m)),
+    Discriminator(get_message_type),
 ]
+
+# Adapters built lazily (and only once) so importing this module does not
+# pay for resolving the discriminated-union schema; the first parse/dump
+# call builds the adapter and every later call reuses it.
+@lru_cache(maxsize=None)
+def _message_adapter() -> TypeAdapter:
+    """Build the single-Message adapter on first use."""
+    return TypeAdapter(Message)
+
+
+@lru_cache(maxsize=None)
+def _messages_adapter() -> TypeAdapter:
+    """Build the List[Message] adapter on first use."""
+    return TypeAdapter(List[Message])
+
+
+def parse_message(data: Any) -> Message:
+    """Validate a single message dict/instance against the Message union."""
+    return _message_adapter().validate_python(data)
+
+
+def parse_messages(data: Any) -> List[Message]:
+    """Validate a list of mixed message dicts/instances in one pass."""
+    return _messages_adapter().validate_python(data)
+
+
+def dump_message(message: Message) -> Any:
+    """Dump a single message back to plain Python data."""
+    return _message_adapter().dump_python(message)
+
+
+def dump_messages(messages: List[Message]) -> Any:
+    """Dump a list of messages back to plain Python data in one pass."""
+    return _messages_adapter().dump_python(messages)
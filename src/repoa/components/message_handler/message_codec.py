@@ -0,0 +1,89 @@
+"""Fast JSON (de)serialization for message payloads using msgspec."""
+
+from __future__ import annotations
+from typing import Any, Dict, List, Sequence
+import msgspec
+
+from .base_types import BaseMessage
+
+# Module-level encoder/decoder instances so the msgspec machinery is
+# built once and reused across every call (C-level, no per-call setup).
+_encoder = msgspec.json.Encoder()
+_message_decoder = msgspec.json.Decoder(Dict[str, Any])
+_messages_decoder = msgspec.json.Decoder(List[Dict[str, Any]])
+
+
+def encode_message(message: BaseMessage) -> bytes:
+    """
+    Encode a single message to JSON bytes.
+
+    Args:
+        message: Any message instance
+
+    Returns:
+        JSON-encoded bytes
+    """
+    return _encoder.encode(message.model_dump())
+
+
+def encode_messages(messages: Sequence[BaseMessage]) -> bytes:
+    """
+    Encode a sequence of messages to a JSON array.
+
+    Args:
+        messages: Sequence of message instances
+
+    Returns:
+        JSON-encoded bytes for the whole sequence
+    """
+    return _encoder.encode([m.model_dump() for m in messages])
+
+
+def decode_message_dict(data: bytes) -> Dict[str, Any]:
+    """
+    Decode JSON bytes into a message-shaped dict.
+
+    The result matches the TypedDict shapes in this package and can be
+    fed to the message classes for validation when needed.
+
+    Args:
+        data: JSON-encoded bytes for one message
+
+    Returns:
+        Decoded dictionary
+    """
+    return _message_decoder.decode(data)
+
+
+def decode_message_dicts(data: bytes) -> List[Dict[str, Any]]:
+    """
+    Decode JSON bytes into a list of message-shaped dicts.
+
+    Args:
+        data: JSON-encoded bytes for a message array
+
+    Returns:
+        List of decoded dictionaries
+    """
+    return _messages_decoder.decode(data)
+
+
+dumps_message = encode_message
+"""Serialize a message to JSON bytes via msgspec (alias of encode_message)."""
+
+
+def loads_message(data: bytes):
+    """
+    Deserialize JSON bytes into a validated Message instance.
+
+    Decoding runs through msgspec's C decoder; only the final
+    discriminated-union validation goes through pydantic.
+
+    Args:
+        data: JSON-encoded bytes for one message
+
+    Returns:
+        Validated message instance from the Message union
+    """
+    from .message import parse_message
+    return parse_message(_message_decoder.decode(data))
@@ -0,0 +1,134 @@
+"""Object pool for short-lived message instances."""
+
+from __future__ import annotations
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Type
+
+from .base_types import BaseMessage
+from .assistant_message import AssistantMessage
+from .system_message import SystemMessage
+from .user_message import UserMessage
+
+DEFAULT_POOL_SIZE = 1024
+"""Maximum number of released instances kept per message class."""
+
+
+class MessagePool:
+    """
+    Thread-local free-lists for hot message types.
+
+    High-QPS conversation loops allocate a fresh message per turn, paying
+    pydantic validation and GC tracking every time. Acquiring from the
+    pool reuses a released instance and writes the new field values
+    directly, so callers must pass pre-validated values.
+
+    Free-lists are kept per thread to avoid locking.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_POOL_SIZE):
+        """
+        Initialize the pool.
+
+        Args:
+            max_size: Bound on each per-class free-list
+        """
+        self.max_size = max_size
+        self._local = threading.local()
+
+    def _free_list(self, message_cls: Type[BaseMessage]) -> Deque[BaseMessage]:
+        """Get (or create) the current thread's free-list for a class."""
+        free_lists = getattr(self._local, "free_lists", None)
+        if free_lists is None:
+            free_lists = {}
+            self._local.free_lists = free_lists
+        free = free_lists.get(message_cls)
+        if free is None:
+            free = deque(maxlen=self.max_size)
+            free_lists[message_cls] = free
+        return free
+
+    def _acquire(
+        self,
+        message_cls: Type[BaseMessage],
+        fields: Dict[str, Any],
+    ) -> BaseMessage:
+        """Pop a pooled instance and reset it, or build a fresh one."""
+        free = self._free_list(message_cls)
+        if not free:
+            return message_cls(**fields)
+        msg = free.pop()
+        # Restore declared defaults, then overlay the caller's values,
+        # writing straight into __dict__ to skip re-validation.
+        values = {
+            name: field.get_default(call_default_factory=True)
+            for name, field in message_cls.model_fields.items()
+        }
+        values.update(fields)
+        msg.__dict__.update(values)
+        return msg
+
+    def acquire_user(self, payload, **kwargs) -> UserMessage:
+        """
+        Get a UserMessage with the given payload.
+
+        Args:
+            payload: Message payload (mirrored into content)
+            **kwargs: Additional pre-validated field values
+
+        Returns:
+            A pooled or freshly constructed UserMessage
+        """
+        kwargs.setdefault("content", payload)
+        kwargs["payload"] = payload
+        return self._acquire(UserMessage, kwargs)
+
+    def acquire_assistant(self, response, **kwargs) -> AssistantMessage:
+        """
+        Get an AssistantMessage with the given response.
+
+        Args:
+            response: Response text (mirrored into content)
+            **kwargs: Additional pre-validated field values
+
+        Returns:
+            A pooled or freshly constructed AssistantMessage
+        """
+        kwargs.setdefault("content", response)
+        kwargs["response"] = response
+        return self._acquire(AssistantMessage, kwargs)
+
+    def acquire_system(self, instructions, **kwargs) -> SystemMessage:
+        """
+        Get a SystemMessage with the given instructions.
+
+        Args:
+            instructions: Instruction text (mirrored into content)
+            **kwargs: Additional pre-validated field values
+
+        Returns:
+            A pooled or freshly constructed SystemMessage
+        """
+        kwargs.setdefault("content", instructions)
+        kwargs["instructions"] = instructions
+        return self._acquire(SystemMessage, kwargs)
+
+    def release(self, msg: BaseMessage) -> None:
+        """
+        Return a message to the pool for reuse.
+
+        The caller must not touch the instance after releasing it.
+
+        Args:
+            msg: Message previously acquired from this pool
+        """
+        invocations = msg.__dict__.get("tool_invocations")
+        if isinstance(invocations, list):
+            invocations.clear()
+        elif invocations:
+            msg.__dict__["tool_invocations"] = ()
+        self._free_list(type(msg)).append(msg)
+
+
+default_message_pool = MessagePool()
+"""Shared pool for callers that do not need their own sizing."""
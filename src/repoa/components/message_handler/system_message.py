@@ -1,8 +1,9 @@
 """System message type."""
 
 from __future__ import annotations
+from functools import lru_cache
 from typing import Optional
-from pydantic import Field
+from pydantic import ConfigDict, Field, model_validator
 from typing_extensions import TypedDict, NotRequired
 from .base_types import BaseMessage
 
@@ -16,24 +17,65 @@ class SystemMessageTypedDict(TypedDict):
 
 
 class SystemMessage(BaseMessage):
-    """Represents a system message with instructions/configuration."""
-    
+    """
+    Represents a system message with instructions/configuration.
+
+    Instances are frozen: a system prompt is logically immutable once
+    created, which makes it hashable and safe to deduplicate via
+    get_system_message. Re-sending one shared prompt object per
+    conversation also keeps it byte-identical across turns, which is
+    what provider-side prompt caching keys on.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        revalidate_instances="never",
+    )
+
+    __msg_tag__ = "system"
+
     instructions: str = Field(default="")
     priority: int = Field(default=0)
     context_scope: Optional[str] = None
-    
-    def __init__(
-        self,
-        instructions: str,
-        priority: int = 0,
-        context_scope: Optional[str] = None,
-        **kwargs
-    ):
-        """Initialize system message."""
-        super().__init__(
-            content=instructions,
-            instructions=instructions,
-            priority=priority,
-            context_scope=context_scope,
-            **kwargs
-        )
+
+    @model_validator(mode="before")
+    @classmethod
+    def _mirror_instructions_into_content(cls, data):
+        """Default content to the instructions in a single validation pass."""
+        if isinstance(data, dict) and "content" not in data:
+            # Copy: the dict is the caller's own object on
+            # model_validate/parse_message paths
+            data = {**data, "content": data.get("instructions", "")}
+        return data
+
+    def __hash__(self):
+        """Hash on the identifying prompt fields (metadata is excluded)."""
+        return hash((self.instructions, self.priority, self.context_scope))
+
+
+@lru_cache(maxsize=256)
+def get_system_message(
+    instructions: str,
+    priority: int = 0,
+    context_scope: Optional[str] = None,
+) -> SystemMessage:
+    """
+    Get a deduplicated SystemMessage for the given prompt.
+
+    Identical prompts collapse to one cached instance, so repeated turns
+    re-send the exact same object/bytes instead of rebuilding it.
+
+    Args:
+        instructions: System instructions/prompt text
+        priority: Message priority
+        context_scope: Optional context scope
+
+    Returns:
+        Cached frozen SystemMessage
+    """
+    return SystemMessage(
+        instructions=instructions,
+        priority=priority,
+        context_scope=context_scope,
+    )
@@ -1,11 +1,14 @@
 """Tool message type."""
 
 from __future__ import annotations
-from typing import Optional, Any
-from pydantic import Field
+from typing import Any, Literal, Optional
+from pydantic import Field, model_serializer, model_validator
 from typing_extensions import TypedDict, NotRequired
 from .base_types import BaseMessage
 
+_LAZY_CONTENT = "__lazy_tool_content__"
+"""Sentinel satisfying validation; stripped again before first access."""
+
 
 class ToolMessageTypedDict(TypedDict):
     """Type dictionary for tool messages."""
@@ -18,27 +21,51 @@ class ToolMessageTypedDict(TypedDict):
 
 class ToolMessage(BaseMessage):
     """Represents a response from a tool/function execution."""
-    
-    handler: str = "tool"
+
+    __msg_tag__ = "tool"
+
+    handler: Literal["tool"] = "tool"
     tool_call_id: str = Field(default="")
     execution_result: Any = None
     execution_status: Optional[str] = None
-    
-    def __init__(
-        self,
-        tool_call_id: str,
-        execution_result: Any,
-        handler: str = "tool",
-        execution_status: Optional[str] = None,
-        **kwargs
-    ):
-        """Initialize tool message."""
-        content_str = f"Tool {tool_call_id} result: {execution_result}"
-        super().__init__(
-            content=content_str,
-            handler=handler,
-            tool_call_id=tool_call_id,
-            execution_result=execution_result,
-            execution_status=execution_status,
-            **kwargs
-        )
+
+    @model_validator(mode="before")
+    @classmethod
+    def _defer_content_formatting(cls, data):
+        """Mark content for lazy formatting instead of eagerly stringifying the result."""
+        if isinstance(data, dict) and "content" not in data:
+            # Copy: the dict is the caller's own object on
+            # model_validate/parse_message paths
+            data = {**data, "content": _LAZY_CONTENT}
+        return data
+
+    @model_validator(mode="after")
+    def _strip_deferred_content(self) -> ToolMessage:
+        """Drop the sentinel so deferred content is absent, not present."""
+        # Reads of an absent field miss __dict__ and fall through to
+        # __getattr__ below; every other attribute access (and every
+        # access once content is materialized) stays on the C fast path.
+        if self.__dict__.get("content") == _LAZY_CONTENT:
+            del self.__dict__["content"]
+        return self
+
+    def _format_content(self) -> str:
+        """Build and cache the human-readable content string."""
+        content = f"Tool {self.tool_call_id} result: {self.execution_result}"
+        self.__dict__["content"] = content
+        return content
+
+    def __getattr__(self, name):
+        # Only fires on misses — i.e. while content is still deferred.
+        # Formatting execution_result can repr() arbitrarily large tool
+        # output, so it only happens on first read.
+        if name == "content":
+            return self._format_content()
+        return super().__getattr__(name)
+
+    @model_serializer(mode="wrap")
+    def _materialize_for_dump(self, handler):
+        """Materialize deferred content before dumping."""
+        if "content" not in self.__dict__:
+            self._format_content()
+        return handler(self)
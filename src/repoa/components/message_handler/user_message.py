@@ -1,8 +1,8 @@
 """User message type."""
 
 from __future__ import annotations
-from typing import List, Optional, Union
-from pydantic import Field, BaseModel
+from typing import List, Literal, Optional, Union
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from typing_extensions import Annotated, TypedDict, NotRequired
 from .base_types import BaseMessage, ContentBlock
 
@@ -18,7 +18,9 @@ class UserContentItemTypedDict(TypedDict):
 
 class UserContentItem(BaseModel):
     """Represents a content item in user message."""
-    
+
+    model_config = ConfigDict(extra="forbid")
+
     type: str
     text: Optional[str] = None
     url: Optional[str] = None
@@ -36,28 +38,51 @@ class UserMessageTypedDict(TypedDict):
 
 class UserMessage(BaseMessage):
     """Represents a user message with support for multimodal content."""
-    
-    sender: str = "user"
+
+    __msg_tag__ = "user"
+
+    sender: Literal["user"] = "user"
     payload: Union[str, List[UserContentItem]] = Field(default="")
     timestamp: Optional[str] = None
     session_id: Optional[str] = None
-    
-    def __init__(
-        self,
-        payload: Union[str, List[UserContentItem]],
-        sender: str = "user",
-        timestamp: Optional[str] = None,
-        session_id: Optional[str] = None,
-        **kwargs
-    ):
-        """Initialize user message."""
-        # Convert payload to content
-        content = payload if isinstance(payload, str) else payload
-        super().__init__(
-            content=content,
-            sender=sender,
-            payload=payload,
-            timestamp=timestamp,
-            session_id=session_id,
-            **kwargs
-        )
+
+    @model_validator(mode="before")
+    @classmethod
+    def _mirror_payload_into_content(cls, data):
+        """Default content to the payload in a single validation pass."""
+        if isinstance(data, dict) and "content" not in data:
+            # Copy: the dict is the caller's own object on
+            # model_validate/parse_message paths
+            data = {**data, "content": data.get("payload", "")}
+        return data
+
+    @classmethod
+    def from_text(cls, text: str, **kwargs) -> UserMessage:
+        """
+        Fast path for plain-text payloads.
+
+        Skips validation entirely via model_construct, so the common str
+        case never touches the Union[str, List[UserContentItem]] schema.
+
+        Args:
+            text: Message text
+            **kwargs: Additional pre-validated field values
+
+        Returns:
+            Constructed UserMessage
+        """
+        return cls.model_construct(payload=text, content=text, **kwargs)
+
+    @classmethod
+    def from_blocks(cls, blocks: List[UserContentItem], **kwargs) -> UserMessage:
+        """
+        Fast path for multimodal block payloads.
+
+        Args:
+            blocks: Already-validated content items
+            **kwargs: Additional pre-validated field values
+
+        Returns:
+            Constructed UserMessage
+        """
+        return cls.model_construct(payload=blocks, content=blocks, **kwargs)
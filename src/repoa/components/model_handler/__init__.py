@@ -3,10 +3,20 @@
 from .model_spec import ModelSpec
 from .provider_info import ProviderInfo, ProviderPreferences
 from .model_pricing import ModelPricing
+from .registry import (
+    get_model_spec,
+    get_provider_prefs,
+    register_model_config,
+    register_provider_config,
+)
 
 __all__ = [
     "ModelSpec",
     "ProviderInfo",
     "ProviderPreferences",
     "ModelPricing",
+    "get_model_spec",
+    "get_provider_prefs",
+    "register_model_config",
+    "register_provider_config",
 ]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing_extensions import TypedDict, NotRequired
 
 
@@ -17,25 +17,10 @@ class ModelPricingTypedDict(TypedDict):
 
 class ModelPricing(BaseModel):
     """Pricing information for a model."""
-    
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     prompt_cost: str = Field(default="0", description="Cost per million prompt tokens")
     completion_cost: str = Field(default="0", description="Cost per million completion tokens")
     image_cost: Optional[str] = None
     audio_cost: Optional[str] = None
-    
-    def __init__(
-        self,
-        prompt_cost: str = "0",
-        completion_cost: str = "0",
-        image_cost: Optional[str] = None,
-        audio_cost: Optional[str] = None,
-        **kwargs
-    ):
-        """Initialize model pricing."""
-        super().__init__(
-            prompt_cost=prompt_cost,
-            completion_cost=completion_cost,
-            image_cost=image_cost,
-            audio_cost=audio_cost,
-            **kwargs
-        )
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 from typing import List, Optional, Literal, Union
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing_extensions import TypedDict, NotRequired
 
 
@@ -17,7 +17,9 @@ class ProviderInfoTypedDict(TypedDict):
 
 class ProviderInfo(BaseModel):
     """Information about an AI service provider."""
-    
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     provider_id: str
     provider_name: str
     is_available: bool = True
@@ -37,31 +39,12 @@ class ProviderPreferencesTypedDict(TypedDict):
 
 class ProviderPreferences(BaseModel):
     """User preferences for provider selection."""
-    
+
+    model_config = ConfigDict(extra="forbid")
+
     enable_fallback: bool = Field(default=True, description="Allow fallback to other providers")
     preferred_providers: List[str] = Field(default_factory=list)
     blocked_providers: List[str] = Field(default_factory=list)
     max_price_per_prompt: Optional[str] = None
     sort_by: Literal["price", "latency", "throughput"] = "latency"
     data_retention_policy: Literal["allow", "deny"] = "allow"
-    
-    def __init__(
-        self,
-        enable_fallback: bool = True,
-        preferred_providers: Optional[List[str]] = None,
-        blocked_providers: Optional[List[str]] = None,
-        max_price_per_prompt: Optional[str] = None,
-        sort_by: Literal["price", "latency", "throughput"] = "latency",
-        data_retention_policy: Literal["allow", "deny"] = "allow",
-        **kwargs
-    ):
-        """Initialize provider preferences."""
-        super().__init__(
-            enable_fallback=enable_fallback,
-            preferred_providers=preferred_providers or [],
-            blocked_providers=blocked_providers or [],
-            max_price_per_prompt=max_price_per_prompt,
-            sort_by=sort_by,
-            data_retention_policy=data_retention_policy,
-            **kwargs
-        )
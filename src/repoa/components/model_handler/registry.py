@@ -0,0 +1,80 @@
+"""Cached registry for static model and provider configuration."""
+
+from __future__ import annotations
+from functools import lru_cache
+from typing import Any, Dict
+
+from .model_pricing import ModelPricing
+from .model_spec import ModelSpec
+from .provider_info import ProviderPreferences
+
+# Configuration sources, keyed by model id / preferences profile name.
+# Entries are plain dicts so they can be loaded from any config system;
+# the cached getters below turn them into frozen, shareable instances.
+_model_configs: Dict[str, Dict[str, Any]] = {}
+_provider_configs: Dict[str, Dict[str, Any]] = {}
+
+
+def register_model_config(model_id: str, config: Dict[str, Any]) -> None:
+    """
+    Register (or replace) the configuration for a model.
+
+    Args:
+        model_id: Unique model identifier
+        config: Field values for ModelSpec
+    """
+    _model_configs[model_id] = dict(config)
+    get_model_spec.cache_clear()
+
+
+def register_provider_config(profile: str, config: Dict[str, Any]) -> None:
+    """
+    Register (or replace) a provider-preferences profile.
+
+    Args:
+        profile: Profile name
+        config: Field values for ProviderPreferences
+    """
+    _provider_configs[profile] = dict(config)
+    get_provider_prefs.cache_clear()
+
+
+@lru_cache(maxsize=128)
+def get_model_spec(model_id: str) -> ModelSpec:
+    """
+    Get the ModelSpec for a registered model.
+
+    The spec is built once per model id and cached, so repeated requests
+    collapse to a dict lookup instead of re-running validation.
+
+    Args:
+        model_id: Unique model identifier
+
+    Returns:
+        Cached frozen ModelSpec
+
+    Raises:
+        KeyError if the model id is not registered
+    """
+    config = dict(_model_configs[model_id])
+    pricing = config.get("pricing")
+    if isinstance(pricing, dict):
+        config["pricing"] = ModelPricing(**pricing)
+    return ModelSpec(model_id=model_id, **config)
+
+
+@lru_cache(maxsize=16)
+def get_provider_prefs(profile: str) -> ProviderPreferences:
+    """
+    Get the ProviderPreferences for a registered profile.
+
+    Args:
+        profile: Profile name
+
+    Returns:
+        Cached ProviderPreferences
+
+    Raises:
+        KeyError if the profile is not registered
+    """
+    return ProviderPreferences(**_provider_configs[profile])
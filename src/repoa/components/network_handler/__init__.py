@@ -1,11 +1,17 @@
 """Network handler module for REPOA framework - Workflow orchestration."""
 
+from typing import TYPE_CHECKING
+
 from .constants import START, END
 from .workflow_network import WorkflowNetwork, CompiledWorkflow
 from .node import Node, NodeFunction
 from .edge import Edge, EdgeCondition
 from .network_state import NetworkState, StateDict
-from .execution_engine import ExecutionEngine, ExecutionResult
+from .persistent_state import PersistentStateDict
+from .jit import cond_jit
+
+if TYPE_CHECKING:
+    from .execution_engine import ExecutionEngine, ExecutionResult
 
 __all__ = [
     # Constants
@@ -20,7 +26,20 @@ __all__ = [
     "EdgeCondition",
     "NetworkState",
     "StateDict",
+    "PersistentStateDict",
     # Execution
     "ExecutionEngine",
     "ExecutionResult",
+    "cond_jit",
 ]
+
+
+def __getattr__(name: str):
+    """Load the execution engine module only when first referenced."""
+    # Lazy (PEP 562): importing the package for graph definition alone
+    # skips the engine module; compile() pulls it in when needed.
+    if name in ("ExecutionEngine", "ExecutionResult"):
+        from . import execution_engine
+
+        return getattr(execution_engine, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,15 @@
 """Special node constants for network execution."""
 
+import sys
 from typing import Literal
 
-# Special node identifiers
-START: Literal["__start__"] = "__start__"
+# Special node identifiers, interned so per-hop comparisons against
+# them hit the pointer-equality fast path (node ids are interned the
+# same way when added to a network).
+START: Literal["__start__"] = sys.intern("__start__")
 """Special node representing the entry point of the workflow network."""
 
-END: Literal["__end__"] = "__end__"
+END: Literal["__end__"] = sys.intern("__end__")
 """Special node representing the exit point of the workflow network."""
 
 # Network execution constants
@@ -1,8 +1,9 @@
 """Edge definitions for workflow routing."""
 
 from __future__ import annotations
-from typing import Callable, Dict, Any, Optional, Union, List
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Any, Optional, Tuple, List
+from .constants import END
 from .network_state import StateDict
 
 
@@ -11,63 +12,48 @@ EdgeCondition = Callable[[StateDict], str]
 """Callable that takes state and returns next node ID."""
 
 
-class Edge(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Edge:
     """
     Represents a connection between two nodes in the workflow.
-    
+
     Edges can be:
     - Simple: Always route to the same next node
     - Conditional: Route based on state values
+
+    Implemented as a frozen slots dataclass: edges are consulted on
+    every hop, so attribute access stays a single slot load with no
+    validator indirection, and routing metadata cannot drift after the
+    engine has indexed it.
     """
-    
-    source_node: str = Field(..., description="ID of source node")
+
+    source_node: str
     target_node: Optional[str] = None
     description: Optional[str] = None
     condition: Optional[EdgeCondition] = None
-    condition_name: str = Field(default="", description="Name of condition function")
-    is_conditional: bool = Field(default=False, description="Whether this edge is conditional")
-    
-    class Config:
-        """Pydantic config."""
-        arbitrary_types_allowed = True
-    
-    def __init__(
-        self,
-        source_node: str,
-        target_node: Optional[str] = None,
-        description: Optional[str] = None,
-        condition: Optional[EdgeCondition] = None,
-        **kwargs
-    ):
-        """
-        Initialize an edge.
-        
-        Args:
-            source_node: ID of node this edge comes from
-            target_node: ID of node to route to (for unconditional edges)
-            description: Human-readable description
-            condition: Function for conditional routing
-        """
-        condition_name = condition.__name__ if condition else ""
-        is_conditional = condition is not None
-        
-        super().__init__(
-            source_node=source_node,
-            target_node=target_node,
-            description=description,
-            condition=condition,
-            condition_name=condition_name,
-            is_conditional=is_conditional,
-            **kwargs
-        )
-    
+
+    # Both derivable from condition at no cost, so they are properties
+    # rather than stored slots — nothing to compute or validate when
+    # constructing the hundreds of edges in a large graph.
+    @property
+    def is_conditional(self) -> bool:
+        """Whether this edge routes through a condition callable."""
+        return self.condition is not None
+
+    @property
+    def condition_name(self) -> str:
+        """Name of the condition callable, or empty for simple edges."""
+        if self.condition is None:
+            return ""
+        return getattr(self.condition, "__name__", "")
+
     def route(self, state: StateDict) -> str:
         """
         Determine next node based on this edge.
-        
+
         Args:
             state: Current workflow state
-            
+
         Returns:
             ID of the next node to execute
         """
@@ -79,78 +65,143 @@ class Edge(BaseModel):
             raise RuntimeError(f"Edge from {self.source_node} has no routing target")
 
 
-class ConditionalEdge(Edge):
+@dataclass(slots=True, frozen=True)
+class ConditionalEdge:
     """
     Edge with multiple possible destinations based on state.
     Routes to one of several target nodes based on a condition function.
+
+    A standalone dataclass (not an Edge subclass) to keep slot layouts
+    flat; it exposes the same routing attributes EdgeSet relies on.
     """
-    
-    target_nodes: List[str] = Field(default_factory=list, description="Possible target nodes")
-    
-    def __init__(
-        self,
-        source_node: str,
-        target_nodes: List[str],
-        condition: EdgeCondition,
-        description: Optional[str] = None,
-        **kwargs
-    ):
+
+    source_node: str
+    target_nodes: List[str] = field(default_factory=list)
+    condition: Optional[EdgeCondition] = None
+    description: Optional[str] = None
+    target_map: Dict[str, str] = field(default_factory=dict)
+    target_node: Optional[str] = field(init=False, default=None)
+    # Possible targets as a frozenset so validate() checks them in O(1)
+    target_set: frozenset = field(init=False, default=frozenset())
+
+    # Compiled router: one condition call plus one dict get, with the
+    # default target resolved once here instead of on every hop.
+    _router: Optional[EdgeCondition] = field(init=False, repr=False, default=None)
+
+    def __post_init__(self):
+        """Compile the condition + target map into a single callable."""
+        # object.__setattr__: the dataclass is frozen, and the derived
+        # slots are only written here
+        if self.target_map:
+            object.__setattr__(
+                self, "target_set", frozenset(self.target_map.values())
+            )
+        elif self.target_nodes:
+            object.__setattr__(self, "target_set", frozenset(self.target_nodes))
+        if self.condition is not None and self.target_map:
+            mapping = dict(self.target_map)
+            default = mapping.get("default", END)
+            condition = self.condition
+
+            def route_mapped(
+                state: StateDict,
+                _map=mapping,
+                _default=default,
+                _condition=condition,
+            ) -> str:
+                return _map.get(_condition(state), _default)
+
+            object.__setattr__(self, "_router", route_mapped)
+
+    @property
+    def is_conditional(self) -> bool:
+        """Always True; routing goes through the condition."""
+        return True
+
+    @property
+    def condition_name(self) -> str:
+        """Name of the condition callable, or empty when unset."""
+        if self.condition is None:
+            return ""
+        return getattr(self.condition, "__name__", "")
+
+    def route(self, state: StateDict) -> str:
         """
-        Initialize a conditional edge.
-        
+        Determine next node based on the condition.
+
         Args:
-            source_node: ID of node this edge comes from
-            target_nodes: List of possible destination node IDs
-            condition: Function that returns which target to use
-            description: Human-readable description
+            state: Current workflow state
+
+        Returns:
+            ID of the next node to execute
         """
-        super().__init__(
-            source_node=source_node,
-            target_node=None,
-            condition=condition,
-            description=description,
-            **kwargs
-        )
-        self.target_nodes = target_nodes
+        if self._router is not None:
+            return self._router(state)
+        if self.condition is None:
+            raise RuntimeError(f"Edge from {self.source_node} has no routing target")
+        return self.condition(state)
 
 
-class EdgeSet(BaseModel):
-    """Collection of edges in the network."""
-    
-    edges: List[Edge] = Field(default_factory=list)
-    
+@dataclass(slots=True)
+class EdgeSet:
+    """Collection of edges in the network, indexed by source node."""
+
+    edges: List[Edge] = field(default_factory=list)
+
+    # Adjacency index and per-source routing pair, maintained
+    # incrementally so per-hop lookups are O(1) instead of O(E) scans.
+    _by_source: Dict[str, List[Edge]] = field(
+        init=False, repr=False, default_factory=dict
+    )
+    _routes: Dict[str, Tuple[Optional[Edge], Optional[str]]] = field(
+        init=False, repr=False, default_factory=dict
+    )
+
+    def __post_init__(self):
+        """Rebuild the index when constructed with pre-populated edges."""
+        for edge in self.edges:
+            self._index_edge(edge)
+
+    def _index_edge(self, edge: Edge) -> None:
+        """Record an edge in the adjacency index and routing pair."""
+        self._by_source.setdefault(edge.source_node, []).append(edge)
+        conditional, simple_target = self._routes.get(
+            edge.source_node, (None, None)
+        )
+        if edge.is_conditional:
+            if conditional is None:
+                conditional = edge
+        elif edge.target_node and simple_target is None:
+            simple_target = edge.target_node
+        self._routes[edge.source_node] = (conditional, simple_target)
+
     def add_edge(self, edge: Edge) -> None:
         """Add an edge to the set."""
         self.edges.append(edge)
-    
+        self._index_edge(edge)
+
     def get_edges_from(self, source_node: str) -> List[Edge]:
         """Get all edges originating from a node."""
-        return [e for e in self.edges if e.source_node == source_node]
-    
+        # Fresh list: handing out the index bucket itself would let
+        # callers corrupt the adjacency index by mutating the result
+        return list(self._by_source.get(source_node, ()))
+
     def get_next_node(self, source_node: str, state: StateDict) -> Optional[str]:
         """
         Get next node for a given source node and state.
-        
+
         Args:
             source_node: Current node ID
             state: Current workflow state
-            
+
         Returns:
             Next node ID or None if no edge found
         """
-        edges = self.get_edges_from(source_node)
-        
-        if not edges:
+        route = self._routes.get(source_node)
+        if route is None:
             return None
-        
-        # Conditional edges first
-        for edge in edges:
-            if edge.is_conditional:
-                return edge.route(state)
-        
-        # Simple edges second
-        for edge in edges:
-            if not edge.is_conditional and edge.target_node:
-                return edge.target_node
-        
-        return None
+        conditional, simple_target = route
+        # Conditional edges take priority over simple edges
+        if conditional is not None:
+            return conditional.route(state)
+        return simple_target
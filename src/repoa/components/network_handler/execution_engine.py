@@ -1,27 +1,104 @@
 """Execution engine for workflow Network - Based on Pregel algorithm concept."""
 
 from __future__ import annotations
-from typing import Dict, Tuple, Iterator, Optional, List
+import asyncio
+import time
+from collections import deque
+from typing import (
+    AsyncIterator,
+    Callable,
+    Dict,
+    Tuple,
+    Iterator,
+    Optional,
+    List,
+    Union,
+)
 from dataclasses import dataclass, field
 from datetime import datetime
 from .constants import START, END, MAX_ITERATIONS
 from .network_state import StateDict, NetworkState
 from .node import Node
 
+_PERF_EPOCH_NS = time.time_ns() - time.perf_counter_ns()
+"""Offset mapping perf_counter_ns readings onto the wall clock."""
 
-@dataclass
+
+@dataclass(slots=True)
 class ExecutionStep:
-    """Represents a single step in execution."""
-    
+    """
+    Represents a single step in execution.
+
+    Only the node's update dict and a state version counter are recorded
+    by default; full before/after snapshots cost O(|state|) copies per
+    step and are captured only when execute(record_snapshots=True).
+    Timing is a perf_counter_ns reading — one cheap clock call per edge
+    instead of datetime.now() object construction — and the wall-clock
+    timestamp is derived lazily on access.
+    """
+
     node_id: str
-    timestamp: datetime = field(default_factory=datetime.now)
-    state_before: Optional[StateDict] = None
-    state_after: Optional[StateDict] = None
+    start_ns: int = 0
+    updates: Optional[StateDict] = None
+    prev_version: int = 0
     error: Optional[str] = None
     duration_ms: float = 0.0
+    snapshots: Optional[Tuple[StateDict, StateDict]] = None
+
+    @property
+    def timestamp(self) -> datetime:
+        """Wall-clock start time, derived lazily from start_ns."""
+        return datetime.fromtimestamp((self.start_ns + _PERF_EPOCH_NS) / 1e9)
+
+    @property
+    def state_before(self) -> StateDict:
+        """Full state before the step; requires record_snapshots=True."""
+        if self.snapshots is None:
+            raise RuntimeError(
+                "State snapshots were not recorded; "
+                "pass record_snapshots=True to execute()"
+            )
+        return self.snapshots[0]
+
+    @property
+    def state_after(self) -> StateDict:
+        """Full state after the step; requires record_snapshots=True."""
+        if self.snapshots is None:
+            raise RuntimeError(
+                "State snapshots were not recorded; "
+                "pass record_snapshots=True to execute()"
+            )
+        return self.snapshots[1]
+
+
+@dataclass(slots=True, frozen=True)
+class ExecutionPlan:
+    """
+    Immutable structure-of-arrays form of a compiled graph.
+
+    node_ids and invokes are parallel tuples indexed by a dense int
+    node index; succ_offsets/succ_targets hold the simple-edge
+    adjacency in CSR layout (successors of node i are
+    succ_targets[succ_offsets[i]:succ_offsets[i + 1]]). Built once per
+    engine, so graph analyses walk flat contiguous tuples instead of
+    chasing node/edge objects through dicts — and the plan cannot
+    drift if the source network is later mutated.
+    """
+
+    node_ids: Tuple[str, ...]
+    invokes: Tuple[Callable, ...]
+    index: Dict[str, int]
+    succ_offsets: Tuple[int, ...]
+    succ_targets: Tuple[int, ...]
+
+    def successors(self, idx: int) -> Tuple[int, ...]:
+        """Int indices of nodes reachable from idx over simple edges."""
+        return self.succ_targets[
+            self.succ_offsets[idx] : self.succ_offsets[idx + 1]
+        ]
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     """Result of complete workflow execution."""
     
@@ -51,91 +128,693 @@ class ExecutionEngine:
             network: WorkflowNetwork to execute
         """
         self.network = network
-        self.network.validate()
+        # validate() is a full graph walk; skip it when the network was
+        # already validated (e.g. by compile()) and not mutated since.
+        if not getattr(network, "_validated", False):
+            network.validate()
+        self._dispatch = self._build_dispatch()
+        # Pre-resolved raw invoke callables, one per node, so the hot
+        # loop skips both the nodes dict attribute chain and Node.__call__.
+        self._invokes = {
+            node_id: node._invoke for node_id, node in network.nodes.items()
+        }
+        # Nodes whose func is a coroutine function; aexecute()/astream()
+        # await these directly while sync funcs hop through a thread.
+        self._async_nodes = frozenset(
+            node_id
+            for node_id, node in network.nodes.items()
+            if node.func is not None and asyncio.iscoroutinefunction(node.func)
+        )
+        self.plan = self._build_plan()
+        self._static_order, self._static_waves = self._compute_static_schedule()
+        # The schedule frozen into (node_id, invoke) pairs: the static
+        # walkers iterate these tuples with zero per-step dict lookups.
+        self._static_pairs = (
+            None
+            if self._static_order is None
+            else tuple(
+                (node_id, self._invokes[node_id])
+                for node_id in self._static_order
+            )
+        )
+        self._wave_pairs = (
+            None
+            if self._static_waves is None
+            else tuple(
+                tuple((node_id, self._invokes[node_id]) for node_id in wave)
+                for wave in self._static_waves
+            )
+        )
+        self._run_fn = self._compile_static_source()
+        self._fused = self._fuse_chains()
+        # START's outgoing edge is almost always simple; resolving it
+        # once here lets the loops begin at its successor instead of
+        # special-casing START every invocation.
+        start_entry = self._dispatch.get(START)
+        self._start_successor = start_entry if type(start_entry) is str else None
+
+    def _build_plan(self) -> ExecutionPlan:
+        """Freeze the network into the flat ExecutionPlan arrays."""
+        node_ids = tuple(self.network.nodes)
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        invokes = tuple(node._invoke for node in self.network.nodes.values())
+
+        adjacency: List[List[int]] = [[] for _ in node_ids]
+        for edge in self.network.edges.edges:
+            if edge.target_node is None:
+                continue
+            src = index.get(edge.source_node)
+            dst = index.get(edge.target_node)
+            if src is not None and dst is not None:
+                adjacency[src].append(dst)
+
+        offsets = [0]
+        targets: List[int] = []
+        for row in adjacency:
+            targets.extend(row)
+            offsets.append(len(targets))
+        return ExecutionPlan(
+            node_ids=node_ids,
+            invokes=invokes,
+            index=index,
+            succ_offsets=tuple(offsets),
+            succ_targets=tuple(targets),
+        )
+
+    def _fuse_chains(
+        self,
+    ) -> Dict[str, Tuple[Callable, Optional[str], int, str]]:
+        """
+        Fuse maximal simple-edge chains into single callables.
+
+        A chain v0 -> v1 -> ... -> vk where every edge is simple and
+        each internal node has exactly one predecessor always executes
+        as a unit, so the per-hop routing and loop bookkeeping between
+        its nodes is pure overhead. Each fused entry maps the chain head
+        to (callable running all invokes, simple successor after the
+        chain or None, chain length, tail node id); a None successor
+        means the tail routes conditionally and the loop must resolve
+        it from the tail. The dynamic loop jumps straight past the
+        chain when step recording is off.
+        """
+        in_degree: Dict[str, int] = {}
+        for edge in self.network.edges.edges:
+            if edge.target_node:
+                in_degree[edge.target_node] = in_degree.get(edge.target_node, 0) + 1
+
+        def simple_target(node_id: str) -> Optional[str]:
+            entry = self._dispatch.get(node_id)
+            return entry if type(entry) is str else None
+
+        # Walk forward from every node; internal chain members are
+        # collected so only maximal chains keep a head entry.
+        chains: Dict[str, List[str]] = {}
+        internal: set = set()
+        for node_id in self.network.nodes:
+            chain = [node_id]
+            # Conditional edges have no target_node and so contribute
+            # nothing to in_degree, which means a simple-edge cycle fed
+            # by a conditional can look like a chain of in-degree-1
+            # nodes; the seen set stops the walk from looping forever.
+            seen = {node_id}
+            target = simple_target(node_id)
+            while (
+                target in self.network.nodes
+                and target not in seen
+                and in_degree.get(target) == 1
+                and target != self.network.exit_node
+            ):
+                chain.append(target)
+                seen.add(target)
+                target = simple_target(target)
+            if len(chain) > 1:
+                chains[node_id] = chain
+                internal.update(chain[1:])
+
+        fused: Dict[str, Tuple[Callable, Optional[str], int, str]] = {}
+        for head, chain in chains.items():
+            if head in internal:
+                continue
+            invokes = tuple(self._invokes[nid] for nid in chain)
+
+            def run_chain(state: StateDict, _invokes=invokes) -> None:
+                for invoke in _invokes:
+                    updates = invoke(state)
+                    if updates:
+                        state.update(updates)
+
+            tail = chain[-1]
+            fused[head] = (run_chain, simple_target(tail), len(chain), tail)
+        return fused
+
+    def _compile_static_source(self) -> Optional[Callable]:
+        """
+        Generate and exec-compile straight-line source for static graphs.
+
+        For a fixed acyclic schedule the whole run can be emitted as a
+        literal sequence of invoke/update/step blocks — no loop, no dict
+        lookups, no routing objects — then compiled once per engine.
+        Each node's invoke callable is bound into the generated
+        function's globals. Returns None when routing is dynamic.
+        """
+        if self._static_order is None:
+            return None
+
+        namespace: Dict[str, object] = {
+            "ExecutionStep": ExecutionStep,
+            "_time": time,
+        }
+        lines = ["def _run(state, steps):", "    version = 0"]
+        for idx, node_id in enumerate(self._static_order):
+            invoke_name = f"_i{idx}"
+            namespace[invoke_name] = self._invokes[node_id]
+            nid = repr(node_id)
+            lines += [
+                "    _s = _time.perf_counter_ns()",
+                f"    step = ExecutionStep(node_id={nid}, start_ns=_s, prev_version=version)",
+                "    try:",
+                f"        updates = {invoke_name}(state)",
+                "    except Exception as e:",
+                "        step.error = str(e)",
+                "        step.duration_ms = (_time.perf_counter_ns() - _s) / 1e6",
+                f"        raise RuntimeError(f\"Node {{{nid}}} failed: {{e}}\")",
+                "    if updates:",
+                "        if len(updates) == 1:",
+                "            for _k, _v in updates.items():",
+                "                state[_k] = _v",
+                "        else:",
+                "            state.update(updates)",
+                "        version += 1",
+                "    step.updates = updates or {}",
+                "    step.duration_ms = (_time.perf_counter_ns() - _s) / 1e6",
+                "    steps.append(step)",
+            ]
+        source = "\n".join(lines)
+        code = compile(source, f"<graph:{self.network.graph_id}>", "exec")
+        exec(code, namespace)
+        return namespace["_run"]
+
+    def _execute_compiled(
+        self, current_state: StateDict, start_ns: int
+    ) -> ExecutionResult:
+        """Run the exec-compiled straight-line function."""
+        steps: List[ExecutionStep] = []
+        try:
+            self._run_fn(current_state, steps)
+            error = None
+            completed = True
+        except Exception as e:
+            error = str(e)
+            completed = False
+        total_duration = (time.perf_counter_ns() - start_ns) / 1e6
+        return ExecutionResult(
+            final_state=current_state,
+            steps=steps,
+            total_duration_ms=total_duration,
+            iterations=len(steps),
+            error=error,
+            completed=completed,
+        )
+
+    def _compute_static_schedule(
+        self,
+    ) -> Tuple[Optional[List[str]], Optional[List[List[str]]]]:
+        """
+        Precompute a fixed schedule for static acyclic workflows.
+
+        When no edge is conditional and the graph is a DAG, Kahn's
+        algorithm yields both a topological node sequence (walked as a
+        straight loop by execute()) and its level sets: each wave holds
+        nodes whose dependencies are all in earlier waves, so nodes in
+        the same wave are independent and may run concurrently. Returns
+        (None, None) when routing must stay dynamic (conditional edges,
+        cycles, or custom entry/exit points).
+        """
+        edges = self.network.edges.edges
+        if any(e.is_conditional for e in edges):
+            return None, None
+        if self.network.entry_node != START or self.network.exit_node != END:
+            return None, None
+
+        # Only nodes that participate in the edge flow (dict preserves
+        # insertion order for deterministic scheduling).
+        involved: Dict[str, None] = {}
+        for e in edges:
+            if e.source_node in self.network.nodes:
+                involved[e.source_node] = None
+            if e.target_node and e.target_node in self.network.nodes:
+                involved[e.target_node] = None
+
+        in_degree = {node_id: 0 for node_id in involved}
+        successors: Dict[str, List[str]] = {}
+        for e in edges:
+            if e.source_node in involved and e.target_node in involved:
+                successors.setdefault(e.source_node, []).append(e.target_node)
+                in_degree[e.target_node] += 1
+
+        wave = [nid for nid, deg in in_degree.items() if deg == 0]
+        order: List[str] = []
+        waves: List[List[str]] = []
+        while wave:
+            waves.append(wave)
+            order.extend(wave)
+            next_wave: List[str] = []
+            for node_id in wave:
+                for target in successors.get(node_id, ()):
+                    in_degree[target] -= 1
+                    if in_degree[target] == 0:
+                        next_wave.append(target)
+            wave = next_wave
+
+        if len(order) != len(involved):
+            return None, None  # Cycle: fall back to dynamic routing
+        return order, waves
+
+    @staticmethod
+    def _fresh_step(
+        scratch: Optional[ExecutionStep],
+        node_id: str,
+        prev_version: int,
+        start_ns: int,
+    ) -> ExecutionStep:
+        """Reset the reusable scratch step, or allocate a new one."""
+        if scratch is None:
+            return ExecutionStep(
+                node_id=node_id, start_ns=start_ns, prev_version=prev_version
+            )
+        scratch.node_id = node_id
+        scratch.start_ns = start_ns
+        scratch.updates = None
+        scratch.prev_version = prev_version
+        scratch.error = None
+        scratch.duration_ms = 0.0
+        scratch.snapshots = None
+        return scratch
+
+    def _execute_static(
+        self,
+        current_state: StateDict,
+        max_iterations: int,
+        record_snapshots: bool,
+        start_ns: int,
+        collect_steps: bool = True,
+        on_step: Optional[Callable[[ExecutionStep], None]] = None,
+    ) -> ExecutionResult:
+        """Run the precomputed node order as a straight loop."""
+        steps: List[ExecutionStep] = []
+        record = collect_steps or on_step is not None
+        # When steps are only streamed to a callback, one scratch
+        # instance is rewritten per hop instead of allocated fresh.
+        scratch = (
+            ExecutionStep(node_id="") if record and not collect_steps else None
+        )
+        iteration = 0
+        version = 0
+        try:
+            for node_id, invoke in self._static_pairs:
+                if iteration >= max_iterations:
+                    break
+                iteration += 1
+                step_start = time.perf_counter_ns()
+                step = (
+                    self._fresh_step(scratch, node_id, version, step_start)
+                    if record
+                    else None
+                )
+                state_before = current_state.copy() if record_snapshots else None
+
+                try:
+                    updates = invoke(current_state)
+                    if updates:
+                        # Single-key updates (the common node return)
+                        # skip the update() call overhead
+                        if len(updates) == 1:
+                            for key, value in updates.items():
+                                current_state[key] = value
+                        else:
+                            current_state.update(updates)
+                        version += 1
+                    if step is not None:
+                        step.updates = updates or {}
+                        if record_snapshots:
+                            step.snapshots = (state_before, current_state.copy())
+                        step.duration_ms = (time.perf_counter_ns() - step_start) / 1e6
+                except Exception as e:
+                    if step is not None:
+                        step.error = str(e)
+                        step.duration_ms = (time.perf_counter_ns() - step_start) / 1e6
+                    raise RuntimeError(f"Node {node_id} failed: {str(e)}")
+
+                if step is not None:
+                    if on_step is not None:
+                        on_step(step)
+                    if collect_steps:
+                        steps.append(step)
+
+            total_duration = (time.perf_counter_ns() - start_ns) / 1e6
+            return ExecutionResult(
+                final_state=current_state,
+                steps=steps,
+                total_duration_ms=total_duration,
+                iterations=iteration,
+                completed=iteration == len(self._static_order),
+            )
+        except Exception as e:
+            total_duration = (time.perf_counter_ns() - start_ns) / 1e6
+            return ExecutionResult(
+                final_state=current_state,
+                steps=steps,
+                total_duration_ms=total_duration,
+                iterations=iteration,
+                error=str(e),
+                completed=False,
+            )
+
+    def execute_parallel(
+        self,
+        initial_state: StateDict,
+        max_workers: Optional[int] = None,
+    ) -> ExecutionResult:
+        """
+        Execute independent branches of a static workflow concurrently.
+
+        Nodes in the same wave of the precomputed schedule have no
+        dependencies on each other, so each wave is dispatched to a
+        thread pool (node functions are typically I/O-bound model or
+        tool calls) and the loop joins before starting the next wave.
+        Update dicts are merged into state in wave order; when two nodes
+        in one wave write the same key, the later node in the schedule
+        wins (last-writer-wins).
+
+        Args:
+            initial_state: Starting state
+            max_workers: Thread pool size (defaults to the pool's own)
+
+        Returns:
+            ExecutionResult with final state and metadata
+
+        Raises:
+            RuntimeError: If the workflow has conditional edges or
+                cycles and therefore no static wave decomposition
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        if self._static_waves is None:
+            raise RuntimeError(
+                "execute_parallel requires a static acyclic workflow; "
+                "use execute() for conditional or cyclic routing"
+            )
+
+        start_ns = time.perf_counter_ns()
+        current_state = initial_state.copy()
+        steps: List[ExecutionStep] = []
+        iteration = 0
+        version = 0
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                for wave in self._wave_pairs:
+                    step_start = time.perf_counter_ns()
+                    if len(wave) == 1:
+                        results = [wave[0][1](current_state)]
+                    else:
+                        results = list(
+                            pool.map(
+                                lambda pair: pair[1](current_state),
+                                wave,
+                            )
+                        )
+                    duration_ms = (time.perf_counter_ns() - step_start) / 1e6
+                    for (node_id, _), updates in zip(wave, results):
+                        iteration += 1
+                        step = ExecutionStep(
+                            node_id=node_id,
+                            start_ns=step_start,
+                            prev_version=version,
+                            updates=updates or {},
+                            duration_ms=duration_ms,
+                        )
+                        if updates:
+                            current_state.update(updates)
+                            version += 1
+                        steps.append(step)
+
+            total_duration = (time.perf_counter_ns() - start_ns) / 1e6
+            return ExecutionResult(
+                final_state=current_state,
+                steps=steps,
+                total_duration_ms=total_duration,
+                iterations=iteration,
+                completed=True,
+            )
+        except Exception as e:
+            total_duration = (time.perf_counter_ns() - start_ns) / 1e6
+            return ExecutionResult(
+                final_state=current_state,
+                steps=steps,
+                total_duration_ms=total_duration,
+                iterations=iteration,
+                error=str(e),
+                completed=False,
+            )
+
+    def _build_dispatch(self) -> Dict[str, Union[str, Callable[[StateDict], str]]]:
+        """
+        Precompile routing into a flat per-node dispatch table.
+
+        Each entry is either the target node id (simple edge) or the raw
+        condition callable (conditional edge), so the hot loop does one
+        dict lookup and at most one call — no pydantic attribute chasing.
+        """
+        dispatch: Dict[str, Union[str, Callable[[StateDict], str]]] = {}
+        for edge in self.network.edges.edges:
+            entry = dispatch.get(edge.source_node)
+            if edge.is_conditional:
+                # Conditional edges take priority over simple edges;
+                # prefer the edge's compiled dict-get router when present
+                if not callable(entry):
+                    router = getattr(edge, "_router", None)
+                    dispatch[edge.source_node] = (
+                        router if router is not None else edge.condition
+                    )
+            elif edge.target_node and entry is None:
+                dispatch[edge.source_node] = edge.target_node
+        return dispatch
+
+    def _next_node(self, current_node: str, state: StateDict) -> Optional[str]:
+        """Resolve the next node from the precompiled dispatch table."""
+        entry = self._dispatch.get(current_node)
+        if entry is None or type(entry) is str:
+            return entry
+        return entry(state)
     
     def execute(
         self,
         initial_state: StateDict,
         max_iterations: int = MAX_ITERATIONS,
+        record_snapshots: bool = False,
+        allow_revisits: bool = True,
+        memoize_routing: bool = False,
+        collect_steps: bool = True,
+        on_step: Optional[Callable[[ExecutionStep], None]] = None,
     ) -> ExecutionResult:
         """
         Execute workflow to completion.
-        
+
         Args:
             initial_state: Starting state
             max_iterations: Max iterations to prevent infinite loops
-            
+            record_snapshots: Capture full before/after state copies per
+                step (costs O(|state|) per node; off by default)
+            allow_revisits: Permit visiting a node more than once. Pass
+                False for workflows meant to be acyclic: a revisit then
+                raises immediately instead of spinning until
+                max_iterations. Agent loops must leave this True.
+            memoize_routing: Cache resolved routes per (node, state
+                version) so unchanged state skips re-running condition
+                callables. Only enable when conditions are pure
+                functions of the state.
+            collect_steps: Retain the per-step history on the result.
+                Pass False for long agent loops that do not inspect
+                steps, avoiding one ExecutionStep and two dicts per hop.
+            on_step: Callback invoked with each completed step (e.g. a
+                logger). With collect_steps=False a single scratch
+                instance is reused between hops, so the callback must
+                not retain it.
+
         Returns:
             ExecutionResult with final state and metadata
         """
-        import time
-        start_time = time.time()
-        
+        start_ns = time.perf_counter_ns()
+
         current_state = initial_state.copy()
+
+        # Static acyclic workflows skip per-step routing entirely; the
+        # exec-compiled form additionally drops the loop and lookups
+        if self._static_order is not None:
+            if (
+                self._run_fn is not None
+                and not record_snapshots
+                and collect_steps
+                and on_step is None
+                and max_iterations >= len(self._static_order)
+            ):
+                return self._execute_compiled(current_state, start_ns)
+            return self._execute_static(
+                current_state,
+                max_iterations,
+                record_snapshots,
+                start_ns,
+                collect_steps,
+                on_step,
+            )
+
         steps: List[ExecutionStep] = []
+        record = collect_steps or on_step is not None
+        scratch = (
+            ExecutionStep(node_id="") if record and not collect_steps else None
+        )
         current_node = self.network.entry_node
+        if current_node == START and self._start_successor is not None:
+            current_node = self._start_successor
         iteration = 0
-        
+        version = 0
+        visited: Optional[set] = None if allow_revisits else set()
+        # Fused chains bypass per-node bookkeeping, so they only apply
+        # when no step/version observers are active.
+        use_fused = (
+            bool(self._fused)
+            and not record
+            and not record_snapshots
+            and not memoize_routing
+            and allow_revisits
+        )
+        # Memo keyed by (node, state version): the version counter only
+        # advances when state changes, so a hit means pure conditions
+        # would resolve identically — no state hashing required.
+        route_cache: Optional[Dict[Tuple[str, int], Optional[str]]] = (
+            {} if memoize_routing else None
+        )
+        # Local bindings: each resolved once instead of per hop
+        next_node_of = self._next_node
+        invokes_get = self._invokes.get
+        fused_get = self._fused.get
+        exit_node = self.network.exit_node
+        perf_ns = time.perf_counter_ns
+
+        def resolve(node: str) -> Optional[str]:
+            if route_cache is None:
+                return next_node_of(node, current_state)
+            key = (node, version)
+            if key in route_cache:
+                return route_cache[key]
+            target = next_node_of(node, current_state)
+            route_cache[key] = target
+            return target
+
         try:
-            while current_node != self.network.exit_node and iteration < max_iterations:
+            while current_node != exit_node and iteration < max_iterations:
                 iteration += 1
-                step_start = time.time()
-                
+                step_start = perf_ns()
+
                 # Execute node if not START
                 if current_node == START:
                     # First edge from START
-                    next_node = self.network.edges.get_next_node(START, current_state)
+                    next_node = resolve(START)
                     if next_node:
                         current_node = next_node
                     else:
                         break
                     continue
-                
+
+                if use_fused:
+                    fused_entry = fused_get(current_node)
+                    if fused_entry is not None:
+                        run_chain, next_node, length, tail = fused_entry
+                        try:
+                            run_chain(current_state)
+                        except Exception as e:
+                            raise RuntimeError(
+                                f"Node {current_node} failed: {str(e)}"
+                            )
+                        iteration += length - 1
+                        if next_node is None:
+                            # The tail routes conditionally (or not at
+                            # all); resolve it like any other node
+                            next_node = resolve(tail)
+                            if next_node is None:
+                                break
+                        current_node = next_node
+                        continue
+
+                if visited is not None:
+                    if current_node in visited:
+                        raise RuntimeError(
+                            f"Node {current_node} revisited in a workflow "
+                            "executed with allow_revisits=False"
+                        )
+                    visited.add(current_node)
+
                 # Get and execute the node
-                if current_node in self.network.nodes:
-                    node = self.network.nodes[current_node]
-                    
-                    step = ExecutionStep(
-                        node_id=current_node,
-                        state_before=current_state.copy(),
+                invoke = invokes_get(current_node)
+                if invoke is not None:
+                    step = (
+                        self._fresh_step(scratch, current_node, version, step_start)
+                        if record
+                        else None
                     )
-                    
+                    state_before = current_state.copy() if record_snapshots else None
+
                     try:
                         # Execute node
-                        updates = node(current_state)
-                        
-                        # Apply updates to state
+                        updates = invoke(current_state)
+
+                        # Apply updates to state; single-key updates
+                        # skip the update() call overhead
                         if updates:
-                            current_state.update(updates)
-                        
-                        step.state_after = current_state.copy()
-                        step.duration_ms = (time.time() - step_start) * 1000
-                        
+                            if len(updates) == 1:
+                                for key, value in updates.items():
+                                    current_state[key] = value
+                            else:
+                                current_state.update(updates)
+                            version += 1
+
+                        if step is not None:
+                            step.updates = updates or {}
+                            if record_snapshots:
+                                step.snapshots = (state_before, current_state.copy())
+                            step.duration_ms = (perf_ns() - step_start) / 1e6
+
                     except Exception as e:
-                        step.error = str(e)
-                        step.duration_ms = (time.time() - step_start) * 1000
+                        if step is not None:
+                            step.error = str(e)
+                            step.duration_ms = (perf_ns() - step_start) / 1e6
                         raise RuntimeError(f"Node {current_node} failed: {str(e)}")
-                    
-                    steps.append(step)
-                
+
+                    if step is not None:
+                        if on_step is not None:
+                            on_step(step)
+                        if collect_steps:
+                            steps.append(step)
+
                 # Find next node
-                next_node = self.network.edges.get_next_node(current_node, current_state)
+                next_node = resolve(current_node)
                 if next_node is None:
                     break
                 current_node = next_node
-            
-            total_duration = (time.time() - start_time) * 1000
+
+            total_duration = (time.perf_counter_ns() - start_ns) / 1e6
             
             return ExecutionResult(
                 final_state=current_state,
                 steps=steps,
                 total_duration_ms=total_duration,
                 iterations=iteration,
-                completed=current_node == self.network.exit_node,
+                completed=current_node == exit_node,
             )
         
         except Exception as e:
-            total_duration = (time.time() - start_time) * 1000
+            total_duration = (time.perf_counter_ns() - start_ns) / 1e6
             return ExecutionResult(
                 final_state=current_state,
                 steps=steps,
@@ -149,27 +828,41 @@ class ExecutionEngine:
         self,
         initial_state: StateDict,
         max_iterations: int = MAX_ITERATIONS,
+        own_state: bool = False,
     ) -> Iterator[Tuple[str, StateDict]]:
         """
         Execute workflow and stream node outputs.
-        
+
         Args:
             initial_state: Starting state
             max_iterations: Max iterations to prevent infinite loops
-            
+            own_state: Treat initial_state as owned by this run and
+                mutate it directly, skipping the upfront copy. The
+                caller's dict then aliases the live workflow state and
+                must not be reused for another run.
+
         Yields:
             Tuples of (node_id, state_update)
         """
-        current_state = initial_state.copy()
+        current_state = initial_state if own_state else initial_state.copy()
         current_node = self.network.entry_node
+        if current_node == START and self._start_successor is not None:
+            # Pre-resolved first hop; keep the START yield for parity
+            # with the dynamic fallback
+            current_node = self._start_successor
+            yield START, {"next_node": current_node}
         iteration = 0
-        
-        while current_node != self.network.exit_node and iteration < max_iterations:
+        # Local bindings: each resolved once instead of per hop
+        next_node_of = self._next_node
+        invokes_get = self._invokes.get
+        exit_node = self.network.exit_node
+
+        while current_node != exit_node and iteration < max_iterations:
             iteration += 1
             
             # Handle START node
             if current_node == START:
-                next_node = self.network.edges.get_next_node(START, current_state)
+                next_node = next_node_of(START, current_state)
                 if next_node:
                     current_node = next_node
                     yield START, {"next_node": next_node}
@@ -178,13 +871,16 @@ class ExecutionEngine:
                 continue
             
             # Execute regular node
-            if current_node in self.network.nodes:
-                node = self.network.nodes[current_node]
-                
+            invoke = invokes_get(current_node)
+            if invoke is not None:
                 try:
-                    updates = node(current_state)
+                    updates = invoke(current_state)
                     if updates:
-                        current_state.update(updates)
+                        if len(updates) == 1:
+                            for key, value in updates.items():
+                                current_state[key] = value
+                        else:
+                            current_state.update(updates)
                         yield current_node, updates
                     else:
                         yield current_node, {}
@@ -193,10 +889,251 @@ class ExecutionEngine:
                     yield current_node, {"error": str(e)}
             
             # Find next node
-            next_node = self.network.edges.get_next_node(current_node, current_state)
+            next_node = next_node_of(current_node, current_state)
             if next_node is None:
                 break
             current_node = next_node
         
-        if current_node == self.network.exit_node:
-            yield self.network.exit_node, current_state
+        if current_node == exit_node:
+            yield exit_node, current_state
+
+    async def _ainvoke_node(self, node_id: str, state: StateDict) -> StateDict:
+        """
+        Invoke one node from the event loop.
+
+        Coroutine node functions are awaited directly; sync functions
+        are pushed to the default executor with asyncio.to_thread so
+        blocking I/O does not stall the loop.
+        """
+        try:
+            if node_id in self._async_nodes:
+                result = await self.network.nodes[node_id].func(state)
+                if result is None:
+                    return {}
+                return result if isinstance(result, dict) else {"result": result}
+            return await asyncio.to_thread(self._invokes[node_id], state)
+        except Exception as e:
+            raise RuntimeError(f"Node {node_id} failed: {str(e)}")
+
+    async def aexecute(
+        self,
+        initial_state: StateDict,
+        max_iterations: int = MAX_ITERATIONS,
+    ) -> ExecutionResult:
+        """
+        Execute workflow asynchronously.
+
+        Node functions may be coroutines (awaited in-loop) or plain
+        callables (run via asyncio.to_thread). For static acyclic
+        workflows each wave of the precomputed schedule runs its nodes
+        concurrently with asyncio.gather, joining between waves; update
+        dicts merge in schedule order (last-writer-wins), matching
+        execute_parallel(). Dynamic workflows fall back to an awaited
+        per-hop loop.
+
+        Args:
+            initial_state: Starting state
+            max_iterations: Max iterations to prevent infinite loops
+
+        Returns:
+            ExecutionResult with final state and metadata
+        """
+        start_ns = time.perf_counter_ns()
+        current_state = initial_state.copy()
+        steps: List[ExecutionStep] = []
+        iteration = 0
+        version = 0
+
+        if self._static_waves is not None:
+            try:
+                for wave in self._static_waves:
+                    # Honor the iteration cap like the sync static
+                    # walker: truncate the wave to the remaining budget
+                    remaining = max_iterations - iteration
+                    if remaining <= 0:
+                        break
+                    if len(wave) > remaining:
+                        wave = wave[:remaining]
+                    step_start = time.perf_counter_ns()
+                    if len(wave) == 1:
+                        results = [
+                            await self._ainvoke_node(wave[0], current_state)
+                        ]
+                    else:
+                        results = await asyncio.gather(
+                            *(
+                                self._ainvoke_node(nid, current_state)
+                                for nid in wave
+                            )
+                        )
+                    duration_ms = (time.perf_counter_ns() - step_start) / 1e6
+                    for node_id, updates in zip(wave, results):
+                        iteration += 1
+                        steps.append(
+                            ExecutionStep(
+                                node_id=node_id,
+                                start_ns=step_start,
+                                updates=updates or {},
+                                prev_version=version,
+                                duration_ms=duration_ms,
+                            )
+                        )
+                        if updates:
+                            current_state.update(updates)
+                            version += 1
+
+                total_duration = (time.perf_counter_ns() - start_ns) / 1e6
+                return ExecutionResult(
+                    final_state=current_state,
+                    steps=steps,
+                    total_duration_ms=total_duration,
+                    iterations=iteration,
+                    completed=iteration == len(self._static_order),
+                )
+            except Exception as e:
+                total_duration = (time.perf_counter_ns() - start_ns) / 1e6
+                return ExecutionResult(
+                    final_state=current_state,
+                    steps=steps,
+                    total_duration_ms=total_duration,
+                    iterations=iteration,
+                    error=str(e),
+                    completed=False,
+                )
+
+        current_node = self.network.entry_node
+        if current_node == START and self._start_successor is not None:
+            current_node = self._start_successor
+        next_node_of = self._next_node
+        exit_node = self.network.exit_node
+
+        try:
+            while current_node != exit_node and iteration < max_iterations:
+                iteration += 1
+
+                if current_node == START:
+                    next_node = next_node_of(START, current_state)
+                    if next_node:
+                        current_node = next_node
+                    else:
+                        break
+                    continue
+
+                if current_node in self._invokes:
+                    step_start = time.perf_counter_ns()
+                    prev_version = version
+                    updates = await self._ainvoke_node(
+                        current_node, current_state
+                    )
+                    if updates:
+                        if len(updates) == 1:
+                            for key, value in updates.items():
+                                current_state[key] = value
+                        else:
+                            current_state.update(updates)
+                        version += 1
+                    steps.append(
+                        ExecutionStep(
+                            node_id=current_node,
+                            start_ns=step_start,
+                            updates=updates or {},
+                            prev_version=prev_version,
+                            duration_ms=(
+                                time.perf_counter_ns() - step_start
+                            ) / 1e6,
+                        )
+                    )
+
+                next_node = next_node_of(current_node, current_state)
+                if next_node is None:
+                    break
+                current_node = next_node
+
+            total_duration = (time.perf_counter_ns() - start_ns) / 1e6
+            return ExecutionResult(
+                final_state=current_state,
+                steps=steps,
+                total_duration_ms=total_duration,
+                iterations=iteration,
+                completed=current_node == exit_node,
+            )
+        except Exception as e:
+            total_duration = (time.perf_counter_ns() - start_ns) / 1e6
+            return ExecutionResult(
+                final_state=current_state,
+                steps=steps,
+                total_duration_ms=total_duration,
+                iterations=iteration,
+                error=str(e),
+                completed=False,
+            )
+
+    async def astream(
+        self,
+        initial_state: StateDict,
+        max_iterations: int = MAX_ITERATIONS,
+    ) -> AsyncIterator[Tuple[str, StateDict]]:
+        """
+        Execute workflow asynchronously and stream node outputs.
+
+        Async counterpart of stream(): coroutine node functions are
+        awaited in-loop, sync functions run via asyncio.to_thread, and
+        each node's updates are yielded as they land.
+
+        Args:
+            initial_state: Starting state
+            max_iterations: Max iterations to prevent infinite loops
+
+        Yields:
+            Tuples of (node_id, state_update)
+        """
+        current_state = initial_state.copy()
+        current_node = self.network.entry_node
+        if current_node == START and self._start_successor is not None:
+            # Pre-resolved first hop; keep the START yield for parity
+            # with the dynamic fallback
+            current_node = self._start_successor
+            yield START, {"next_node": current_node}
+        iteration = 0
+        next_node_of = self._next_node
+        exit_node = self.network.exit_node
+
+        while current_node != exit_node and iteration < max_iterations:
+            iteration += 1
+
+            # Handle START node
+            if current_node == START:
+                next_node = next_node_of(START, current_state)
+                if next_node:
+                    current_node = next_node
+                    yield START, {"next_node": next_node}
+                else:
+                    break
+                continue
+
+            # Execute regular node
+            if current_node in self._invokes:
+                try:
+                    updates = await self._ainvoke_node(
+                        current_node, current_state
+                    )
+                    if updates:
+                        if len(updates) == 1:
+                            for key, value in updates.items():
+                                current_state[key] = value
+                        else:
+                            current_state.update(updates)
+                        yield current_node, updates
+                    else:
+                        yield current_node, {}
+                except Exception as e:
+                    yield current_node, {"error": str(e)}
+
+            # Find next node
+            next_node = next_node_of(current_node, current_state)
+            if next_node is None:
+                break
+            current_node = next_node
+
+        if current_node == exit_node:
+            yield exit_node, current_state
@@ -0,0 +1,61 @@
+"""Optional Numba acceleration for condition and node functions."""
+
+from __future__ import annotations
+from typing import Callable, Dict
+
+_jit_cache: Dict[Callable, Callable] = {}
+"""Per-process cache so a function is compiled at most once."""
+
+
+def cond_jit(fn: Callable) -> Callable:
+    """
+    JIT-compile a function with Numba when possible.
+
+    Condition callables and numeric node functions run on every hop, so
+    pure numeric code benefits from compilation (cache=True persists
+    compiled code to disk, paying the first-call cost once per
+    deployment). The standard dict-based StateDict cannot be typed by
+    Numba's nopython mode, so this is opt-in for functions written over
+    scalar/array arguments; anything Numba cannot compile falls back to
+    the original Python function the first time it is called. A no-op
+    when Numba is not installed.
+
+    Args:
+        fn: Callable to compile
+
+    Returns:
+        The compiled callable, or fn unchanged on fallback
+    """
+    cached = _jit_cache.get(fn)
+    if cached is not None:
+        return cached
+
+    try:
+        import numba
+    except ImportError:
+        _jit_cache[fn] = fn
+        return fn
+
+    try:
+        jitted = numba.njit(cache=True)(fn)
+    except Exception:
+        # Decoration itself can fail — e.g. cache=True has no locator
+        # for REPL/exec-defined functions — so anything Numba rejects
+        # here keeps the plain Python function, as promised above.
+        _jit_cache[fn] = fn
+        return fn
+
+    def dispatch(*args, **kwargs):
+        nonlocal target
+        try:
+            return target(*args, **kwargs)
+        except numba.errors.TypingError:
+            # Untypeable arguments (e.g. dict states): fall back to the
+            # plain Python function for all subsequent calls.
+            target = fn
+            return fn(*args, **kwargs)
+
+    target = jitted
+    dispatch.__name__ = getattr(fn, "__name__", "cond_jit")
+    _jit_cache[fn] = dispatch
+    return dispatch
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 from typing import Any, Dict, Optional, TypeVar, Generic, Union
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing_extensions import TypedDict
 
 # Type aliases for state representation
@@ -24,18 +24,21 @@ class NetworkState(BaseModel, Generic[T]):
     state_data: T = Field(default_factory=dict, description="Workflow state data")
     history: list[str] = Field(default_factory=list, description="Execution history of node IDs")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
-    
-    class Config:
-        """Pydantic config."""
-        arbitrary_types_allowed = True
-    
+    version: int = Field(default=0, description="Bumped by each in-place update")
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     def update(self, updates: Dict[str, Any]) -> NetworkState:
         """
         Update state data with new values.
-        
+
+        Clones state_data, history and metadata into a fresh instance —
+        use only when the previous state must stay observable (audit
+        trails); update_inplace is the cheap default otherwise.
+
         Args:
             updates: Dictionary of updates to apply
-            
+
         Returns:
             Updated NetworkState instance
         """
@@ -44,14 +47,42 @@ class NetworkState(BaseModel, Generic[T]):
         else:
             # For Pydantic models
             new_data = self.state_data.copy(update=updates)
-        
-        return NetworkState(
+
+        # model_construct: every field comes from this already-validated
+        # instance, so the clone skips the validator pass
+        return NetworkState.model_construct(
             current_node=self.current_node,
             state_data=new_data,
             history=self.history.copy(),
-            metadata=self.metadata.copy()
+            metadata=self.metadata.copy(),
+            version=self.version + 1,
         )
-    
+
+    def update_inplace(self, updates: Dict[str, Any]) -> NetworkState:
+        """
+        Apply updates by mutating state_data, bumping the version.
+
+        Skips the full clone that update() performs — for a workflow
+        that never inspects old states this turns per-node cost from
+        O(|state|) copies into O(|updates|) writes. The version counter
+        lets callers detect staleness where they previously compared
+        instances.
+
+        Args:
+            updates: Dictionary of updates to apply
+
+        Returns:
+            This instance, for chaining
+        """
+        if isinstance(self.state_data, dict):
+            self.state_data.update(updates)
+        else:
+            # For Pydantic models
+            for key, value in updates.items():
+                setattr(self.state_data, key, value)
+        self.version += 1
+        return self
+
     def record_execution(self, node_id: str) -> None:
         """
         Record node execution in history.
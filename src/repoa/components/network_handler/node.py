@@ -1,8 +1,8 @@
 """Node definitions for workflow execution."""
 
 from __future__ import annotations
+from dataclasses import dataclass, field
 from typing import Callable, Dict, Any, Optional
-from pydantic import BaseModel, Field
 from .network_state import StateDict
 
 
@@ -11,95 +11,78 @@ NodeFunction = Callable[[StateDict], Dict[str, Any]]
 """Callable that takes state dict and returns updates dict."""
 
 
-class Node(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Node:
     """
     Represents a single node in the workflow network.
-    
+
     A node is a discrete unit of work that:
     - Takes current state as input
     - Performs some computation/side-effect
     - Returns state updates
+
+    Implemented as a frozen slots dataclass rather than a pydantic
+    model: nodes sit on the per-step hot path, so construction is a
+    plain tuple init, attribute access is a single slot load, and
+    instances are safely shared across engines without defensive
+    copies.
     """
-    
-    node_id: str = Field(..., description="Unique identifier for this node")
+
+    node_id: str
     func: Optional[NodeFunction] = None
-    func_name: str = Field(default="", description="Name of the function for serialization")
+    func_name: str = ""
     description: Optional[str] = None
-    timeout: Optional[float] = Field(default=None, description="Node execution timeout in seconds")
-    retry_count: int = Field(default=0, description="Number of retry attempts on failure")
-    is_agent: bool = Field(default=False, description="Whether this node runs an agent/LLM")
-    
-    class Config:
-        """Pydantic config."""
-        arbitrary_types_allowed = True
-    
-    def __init__(
-        self,
-        node_id: str,
-        func: Optional[NodeFunction] = None,
-        description: Optional[str] = None,
-        timeout: Optional[float] = None,
-        retry_count: int = 0,
-        is_agent: bool = False,
-        **kwargs
-    ):
-        """
-        Initialize a workflow node.
-        
-        Args:
-            node_id: Unique identifier for the node
-            func: Function that executes the node logic
-            description: Human-readable description
-            timeout: Execution timeout in seconds
-            retry_count: Number of retries on failure
-            is_agent: Whether this is an agent/LLM node
-        """
-        func_name = func.__name__ if func else ""
-        super().__init__(
-            node_id=node_id,
-            func=func,
-            func_name=func_name,
-            description=description,
-            timeout=timeout,
-            retry_count=retry_count,
-            is_agent=is_agent,
-            **kwargs
-        )
-    
+    timeout: Optional[float] = None
+    retry_count: int = 0
+    is_agent: bool = False
+
+    # Raw invoke callable bound once at construction; the engine calls
+    # this directly instead of going through __call__ per step.
+    _invoke: NodeFunction = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Derive func_name and bind the specialized invoke callable."""
+        # object.__setattr__: the dataclass is frozen, and these two
+        # derived slots are only written here
+        if self.func is not None and not self.func_name:
+            object.__setattr__(
+                self, "func_name", getattr(self.func, "__name__", "")
+            )
+        func = self.func
+        if func is None:
+            object.__setattr__(self, "_invoke", lambda state: {})
+        else:
+            def invoke(state: StateDict, _func=func) -> Dict[str, Any]:
+                result = _func(state)
+                if result is None:
+                    return {}
+                return result if isinstance(result, dict) else {"result": result}
+
+            object.__setattr__(self, "_invoke", invoke)
+
     async def execute(self, state: StateDict) -> Dict[str, Any]:
         """
         Execute the node function on the given state.
-        
+
         Args:
             state: Current workflow state
-            
+
         Returns:
             State updates from execution
         """
-        if not self.func:
-            return {}
-        
         try:
-            result = self.func(state)
-            if result is None:
-                return {}
-            return result if isinstance(result, dict) else {"result": result}
+            return self._invoke(state)
         except Exception as e:
             raise RuntimeError(f"Node {self.node_id} execution failed: {str(e)}")
-    
+
     def __call__(self, state: StateDict) -> Dict[str, Any]:
         """
         Convenience method to execute node synchronously.
-        
+
         Args:
             state: Current workflow state
-            
+
         Returns:
             State updates from execution
         """
-        if not self.func:
-            return {}
-        result = self.func(state)
-        if result is None:
-            return {}
-        return result if isinstance(result, dict) else {"result": result}
+        return self._invoke(state)
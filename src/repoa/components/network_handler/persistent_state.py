@@ -0,0 +1,110 @@
+"""Persistent state mapping with structural sharing."""
+
+from __future__ import annotations
+from typing import Any, Dict, Iterator, Mapping, Optional
+
+try:
+    from pyrsistent import pmap
+except ImportError:  # pragma: no cover - optional dependency
+    pmap = None
+
+
+class PersistentStateDict:
+    """
+    State mapping whose snapshots share structure.
+
+    Long agent loops that keep growing values (message lists and the
+    like) pay an O(|state|) dict copy for every snapshot, O(N²) over an
+    N-step run. Backed by a persistent map (pyrsistent's HAMT), copy()
+    is O(1) pointer sharing and update() only rebuilds the touched
+    branch; snapshots and the running state coexist without duplicating
+    unchanged keys.
+
+    Exposes the dict surface the engine and node functions rely on —
+    subscript access, get, update, copy, iteration — so it drops in as
+    the initial_state of execute()/stream(). Falls back to a plain dict
+    when pyrsistent is not installed, keeping behavior identical at
+    dict-copy cost.
+    """
+
+    __slots__ = ("_map",)
+
+    def __init__(self, initial: Optional[Mapping[str, Any]] = None):
+        """
+        Initialize from an optional mapping.
+
+        Args:
+            initial: Starting key/value pairs
+        """
+        if pmap is not None:
+            self._map = pmap(dict(initial) if initial else {})
+        else:
+            self._map = dict(initial) if initial else {}
+
+    def __getitem__(self, key: str) -> Any:
+        return self._map[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if pmap is not None:
+            self._map = self._map.set(key, value)
+        else:
+            self._map[key] = value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._map
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._map)
+
+    def __len__(self) -> int:
+        return len(self._map)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PersistentStateDict):
+            return dict(self._map) == dict(other._map)
+        if isinstance(other, dict):
+            return dict(self._map) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"PersistentStateDict({dict(self._map)!r})"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a value with a default, like dict.get."""
+        return self._map.get(key, default)
+
+    def keys(self):
+        """View of the keys."""
+        return self._map.keys()
+
+    def values(self):
+        """View of the values."""
+        return self._map.values()
+
+    def items(self):
+        """View of the (key, value) pairs."""
+        return self._map.items()
+
+    def update(self, updates: Mapping[str, Any]) -> None:
+        """
+        Merge updates in, rebuilding only the touched branches.
+
+        Args:
+            updates: Key/value pairs to apply
+        """
+        if not updates:
+            return
+        if pmap is not None:
+            self._map = self._map.update(updates)
+        else:
+            self._map.update(updates)
+
+    def copy(self) -> "PersistentStateDict":
+        """Snapshot the current state; O(1) under pyrsistent."""
+        snapshot = PersistentStateDict()
+        snapshot._map = self._map if pmap is not None else dict(self._map)
+        return snapshot
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialize a plain dict (O(|state|))."""
+        return dict(self._map)
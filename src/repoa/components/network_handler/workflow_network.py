@@ -1,13 +1,17 @@
 """Core workflow network implementation - Similar to LangGraph's StateGraph."""
 
 from __future__ import annotations
-from typing import Dict, List, Optional, Any, Callable
-from pydantic import BaseModel, Field
+import sys
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Callable
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 from .constants import START, END
 from .node import Node, NodeFunction
-from .edge import Edge, EdgeSet, EdgeCondition
+from .edge import Edge, ConditionalEdge, EdgeSet, EdgeCondition
 from .network_state import NetworkState, StateDict
-from .execution_engine import ExecutionEngine
+from .jit import cond_jit
+
+if TYPE_CHECKING:
+    from .execution_engine import ExecutionEngine
 
 
 class WorkflowNetwork(BaseModel):
@@ -27,30 +31,45 @@ class WorkflowNetwork(BaseModel):
     entry_node: str = Field(default=START, description="Starting node ID")
     exit_node: str = Field(default=END, description="Exit node ID")
     description: Optional[str] = None
-    
-    class Config:
-        """Pydantic config."""
-        arbitrary_types_allowed = True
-    
+
+    # Set by validate(); engines skip the graph walk when still fresh.
+    # Any mutation of the graph resets it.
+    _validated: bool = PrivateAttr(default=False)
+    # Memoized to_dict() form; invalidated together with _validated.
+    _dict_cache: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     def add_node(
         self,
         node_id: str,
         func: NodeFunction,
         description: Optional[str] = None,
         timeout: Optional[float] = None,
+        jit: bool = False,
     ) -> Node:
         """
         Add a node to the workflow.
-        
+
         Args:
             node_id: Unique identifier for the node
             func: Function that executes the node logic
             description: Human-readable description
             timeout: Execution timeout in seconds
-            
+            jit: JIT-compile func with Numba when installed. Only
+                numeric functions over scalars/arrays are eligible;
+                anything Numba cannot type falls back to plain Python
+                on first call, and the flag is a no-op without Numba.
+
         Returns:
             The created Node
         """
+        if jit:
+            func = cond_jit(func)
+        # Interned ids collapse to one string object per id, so the
+        # dict lookups and == checks on every routing hop resolve by
+        # pointer equality instead of character comparison.
+        node_id = sys.intern(node_id)
         node = Node(
             node_id=node_id,
             func=func,
@@ -58,6 +77,8 @@ class WorkflowNetwork(BaseModel):
             timeout=timeout,
         )
         self.nodes[node_id] = node
+        self._validated = False
+        self._dict_cache = None
         return node
     
     def add_edge(
@@ -78,11 +99,13 @@ class WorkflowNetwork(BaseModel):
             The created Edge
         """
         edge = Edge(
-            source_node=source,
-            target_node=target,
+            source_node=sys.intern(source),
+            target_node=sys.intern(target),
             description=description,
         )
         self.edges.add_edge(edge)
+        self._validated = False
+        self._dict_cache = None
         return edge
     
     def add_conditional_edge(
@@ -91,32 +114,34 @@ class WorkflowNetwork(BaseModel):
         condition: EdgeCondition,
         target_map: Dict[str, str],
         description: Optional[str] = None,
-    ) -> Edge:
+    ) -> ConditionalEdge:
         """
         Add a conditional edge that routes based on state.
-        
+
         Args:
             source: Source node ID
             condition: Function that evaluates state and returns target
             target_map: Map from condition results to target node IDs
             description: Human-readable description
-            
+
         Returns:
-            The created Edge
+            The created ConditionalEdge
         """
-        # Wrap condition to use the mapping
-        def routed_condition(state: StateDict) -> str:
-            result = condition(state)
-            return target_map.get(result, target_map.get("default", END))
-        
-        targets = list(target_map.values())
-        edge = Edge(
-            source_node=source,
-            target_node=None,
-            condition=routed_condition,
+        # The edge compiles condition + mapping into a single dict-get
+        # router at construction; target ids are interned like node ids
+        target_map = {
+            key: sys.intern(target) for key, target in target_map.items()
+        }
+        edge = ConditionalEdge(
+            source_node=sys.intern(source),
+            target_nodes=list(target_map.values()),
+            condition=condition,
             description=description,
+            target_map=target_map,
         )
         self.edges.add_edge(edge)
+        self._validated = False
+        self._dict_cache = None
         return edge
     
     def set_entry_point(self, node_id: str) -> None:
@@ -126,7 +151,9 @@ class WorkflowNetwork(BaseModel):
         Args:
             node_id: ID of node to start from
         """
-        self.entry_node = node_id
+        self.entry_node = sys.intern(node_id)
+        self._validated = False
+        self._dict_cache = None
     
     def set_finish_point(self, node_id: str) -> None:
         """
@@ -135,7 +162,9 @@ class WorkflowNetwork(BaseModel):
         Args:
             node_id: ID of node to end at
         """
-        self.exit_node = node_id
+        self.exit_node = sys.intern(node_id)
+        self._validated = False
+        self._dict_cache = None
     
     def validate(self) -> bool:
         """
@@ -147,21 +176,32 @@ class WorkflowNetwork(BaseModel):
         Raises:
             ValueError if network is invalid
         """
+        # One frozenset per direction instead of rebuilding a
+        # [sentinel] + keys list for every membership test
+        node_ids = frozenset(self.nodes.keys())
+        valid_sources = node_ids | {START}
+        valid_targets = node_ids | {END}
+
         # Check entry point exists
-        if self.entry_node not in [START] + list(self.nodes.keys()):
+        if self.entry_node not in valid_sources:
             raise ValueError(f"Entry point {self.entry_node} not found")
-        
+
         # Check exit point exists
-        if self.exit_node not in [END] + list(self.nodes.keys()):
+        if self.exit_node not in valid_targets:
             raise ValueError(f"Exit point {self.exit_node} not found")
-        
+
         # Check all edges reference valid nodes
         for edge in self.edges.edges:
-            if edge.source_node not in [START] + list(self.nodes.keys()):
+            if edge.source_node not in valid_sources:
                 raise ValueError(f"Edge source {edge.source_node} not found")
-            if edge.target_node and edge.target_node not in [END] + list(self.nodes.keys()):
+            if edge.target_node and edge.target_node not in valid_targets:
                 raise ValueError(f"Edge target {edge.target_node} not found")
-        
+            # Conditional edges expose their possible targets as a set
+            for target in getattr(edge, "target_set", ()):
+                if target not in valid_targets:
+                    raise ValueError(f"Edge target {target} not found")
+
+        self._validated = True
         return True
     
     def compile(self) -> CompiledWorkflow:
@@ -175,15 +215,34 @@ class WorkflowNetwork(BaseModel):
             ValueError if network is invalid
         """
         self.validate()
-        return CompiledWorkflow(network=self)
+        # Imported here, not at module load: graphs defined purely for
+        # schema registration never pay for the engine module
+        from .execution_engine import ExecutionEngine
+
+        # model_construct: this network was just validated and the
+        # engine is built here, so the wrapper's validator pass (which
+        # would re-walk both) is skipped on this trusted path
+        return CompiledWorkflow.model_construct(
+            network=self, engine=ExecutionEngine(network=self)
+        )
     
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert network to dictionary representation.
-        
+
+        The result is memoized until the graph is next mutated, so
+        repeated logging/serialization of a compiled workflow rebuilds
+        nothing. Treat the returned dict as read-only.
+
         Returns:
             Dictionary representation of network
         """
+        if self._dict_cache is None:
+            self._dict_cache = self._build_dict()
+        return self._dict_cache
+
+    def _build_dict(self) -> Dict[str, Any]:
+        """Walk nodes and edges into the dict form."""
         return {
             "graph_id": self.graph_id,
             "description": self.description,
@@ -217,43 +276,65 @@ class CompiledWorkflow(BaseModel):
     
     network: WorkflowNetwork = Field(..., description="The workflow network")
     engine: Optional[ExecutionEngine] = None
-    
-    class Config:
-        """Pydantic config."""
-        arbitrary_types_allowed = True
-    
-    def __init__(self, network: WorkflowNetwork, **kwargs):
-        """
-        Initialize compiled workflow.
-        
-        Args:
-            network: The WorkflowNetwork to compile
-        """
-        super().__init__(network=network, **kwargs)
-        self.engine = ExecutionEngine(network=network)
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    def __init__(self, **data: Any):
+        """Resolve the lazily imported engine type, then validate."""
+        # The ExecutionEngine annotation is deferred until a workflow
+        # is actually compiled or constructed; the first construction
+        # imports it and completes the pydantic schema.
+        if not type(self).__pydantic_complete__:
+            from .execution_engine import ExecutionEngine
+
+            type(self).model_rebuild()
+        super().__init__(**data)
+
+    @model_validator(mode="after")
+    def _build_engine(self) -> CompiledWorkflow:
+        """Construct the execution engine once the network is set."""
+        if self.engine is None:
+            from .execution_engine import ExecutionEngine
+
+            self.engine = ExecutionEngine(network=self.network)
+        return self
     
     def invoke(
         self,
         initial_state: StateDict,
         max_iterations: int = 100,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
     ) -> StateDict:
         """
         Execute the workflow synchronously.
-        
+
         Args:
             initial_state: Starting state dictionary
             max_iterations: Maximum number of node executions
-            
+            parallel: Fork-join execution — run independent branches of
+                a static acyclic workflow concurrently in a thread pool,
+                joining between waves of the precomputed schedule.
+                Raises for conditional or cyclic workflows, which have
+                no static wave decomposition.
+            max_workers: Thread pool size when parallel=True
+
         Returns:
             Final state after execution
         """
         if not self.engine:
             raise RuntimeError("ExecutionEngine not initialized")
-        
-        result = self.engine.execute(
-            initial_state=initial_state,
-            max_iterations=max_iterations,
-        )
+
+        if parallel:
+            result = self.engine.execute_parallel(
+                initial_state=initial_state,
+                max_workers=max_workers,
+            )
+        else:
+            result = self.engine.execute(
+                initial_state=initial_state,
+                max_iterations=max_iterations,
+            )
         return result.final_state
     
     def stream(
@@ -279,3 +360,55 @@ class CompiledWorkflow(BaseModel):
             max_iterations=max_iterations,
         ):
             yield node_id, state_update
+
+    async def ainvoke(
+        self,
+        initial_state: StateDict,
+        max_iterations: int = 100,
+    ) -> StateDict:
+        """
+        Execute the workflow asynchronously.
+
+        Node functions may be coroutines (awaited directly) or plain
+        callables (run via asyncio.to_thread so blocking I/O does not
+        stall the event loop).
+
+        Args:
+            initial_state: Starting state dictionary
+            max_iterations: Maximum number of node executions
+
+        Returns:
+            Final state after execution
+        """
+        if not self.engine:
+            raise RuntimeError("ExecutionEngine not initialized")
+
+        result = await self.engine.aexecute(
+            initial_state=initial_state,
+            max_iterations=max_iterations,
+        )
+        return result.final_state
+
+    async def astream(
+        self,
+        initial_state: StateDict,
+        max_iterations: int = 100,
+    ):
+        """
+        Execute the workflow asynchronously and stream results.
+
+        Args:
+            initial_state: Starting state dictionary
+            max_iterations: Maximum number of node executions
+
+        Yields:
+            Tuples of (node_id, state_update)
+        """
+        if not self.engine:
+            raise RuntimeError("ExecutionEngine not initialized")
+
+        async for node_id, state_update in self.engine.astream(
+            initial_state=initial_state,
+            max_iterations=max_iterations,
+        ):
+            yield node_id, state_update
@@ -1,13 +1,32 @@
 """Response handler module for REPOA framework."""
 
 from .chat_response import ChatResponse, ChatResponseChoice
-from .stream_response import StreamResponse, StreamingChoice
-from .token_usage import TokenUsage
+from .stream_response import (
+    STREAM_FAST_PATH,
+    StreamResponse,
+    StreamingChoice,
+    UsageAccumulator,
+    acquire_stream_response,
+    encode_stream_response,
+    parse_stream_chunk,
+    release_stream_response,
+    stream_response_to_model,
+)
+from .token_usage import EMPTY_USAGE, TokenUsage, aggregate_usage
 
 __all__ = [
     "ChatResponse",
     "ChatResponseChoice",
+    "EMPTY_USAGE",
+    "STREAM_FAST_PATH",
     "StreamResponse",
     "StreamingChoice",
     "TokenUsage",
+    "UsageAccumulator",
+    "acquire_stream_response",
+    "aggregate_usage",
+    "encode_stream_response",
+    "parse_stream_chunk",
+    "release_stream_response",
+    "stream_response_to_model",
 ]
@@ -1,7 +1,9 @@
 """Chat response types."""
 
 from __future__ import annotations
-from typing import List, Optional, Literal
+from typing import Any, List, Optional, Literal
+
+import msgspec
 from pydantic import BaseModel, Field
 from typing_extensions import TypedDict, NotRequired
 from .token_usage import TokenUsage, TokenUsageTypedDict
@@ -47,25 +49,25 @@ class ChatResponse(BaseModel):
     response_type: Literal["chat.completion"] = "chat.completion"
     usage: TokenUsage
     fingerprint: Optional[str] = None
-    
-    def __init__(
-        self,
-        response_id: str,
-        deployed_model: str,
-        generated_at: float,
-        usage: TokenUsage,
-        choices: Optional[List[ChatResponseChoice]] = None,
-        fingerprint: Optional[str] = None,
-        **kwargs
-    ):
-        """Initialize chat response."""
-        super().__init__(
-            response_id=response_id,
-            choices=choices or [],
-            generated_at=generated_at,
-            deployed_model=deployed_model,
-            response_type="chat.completion",
-            usage=usage,
-            fingerprint=fingerprint,
-            **kwargs
-        )
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the response straight to JSON bytes.
+
+        msgspec encodes the model via the enc_hook below — a single C
+        encoder pass instead of model_dump_json()'s Python-level field
+        walk — and HTTP senders write the bytes to the socket with no
+        .encode("utf-8") step.
+
+        Returns:
+            UTF-8 JSON bytes
+        """
+        return _encoder.encode(self)
+
+
+def _enc_hook(obj: Any) -> Any:
+    """Dump pydantic models msgspec cannot encode natively."""
+    return obj.model_dump()
+
+
+_encoder = msgspec.json.Encoder(enc_hook=_enc_hook)
@@ -1,31 +1,40 @@
 """Streaming response types."""
 
 from __future__ import annotations
-from typing import List, Optional, Literal
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Literal
+
+import msgspec
 from typing_extensions import TypedDict, NotRequired
 from .token_usage import TokenUsage, TokenUsageTypedDict
 
 
 class StreamingChoiceTypedDict(TypedDict):
     """Type dictionary for streaming choice."""
-    
+
     index: int
     delta: dict
     finish_reason: NotRequired[Optional[str]]
 
 
-class StreamingChoice(BaseModel):
-    """Represents a streaming completion choice."""
-    
+@dataclass(slots=True)
+class StreamingChoice:
+    """
+    Represents a streaming completion choice.
+
+    A slots dataclass rather than a pydantic model: one instance is
+    built per streamed token, where validation and a per-instance
+    __dict__ are the dominant construction cost.
+    """
+
     index: int
-    delta: dict = Field(default_factory=dict)
+    delta: dict = field(default_factory=dict)
     finish_reason: Optional[str] = None
 
 
 class StreamResponseTypedDict(TypedDict):
     """Type dictionary for streaming response."""
-    
+
     chunk_id: str
     choices: List[StreamingChoiceTypedDict]
     generation_timestamp: float
@@ -34,32 +43,207 @@ class StreamResponseTypedDict(TypedDict):
     usage: NotRequired[TokenUsageTypedDict]
 
 
-class StreamResponse(BaseModel):
-    """Represents a single streaming chunk in a response."""
-    
+@dataclass(slots=True)
+class StreamResponse:
+    """
+    Represents a single streaming chunk in a response.
+
+    Like StreamingChoice, a slots dataclass: chunks arrive per token,
+    so construction is a plain tuple init with no validator passes and
+    no instance dict.
+    """
+
     chunk_id: str
-    choices: List[StreamingChoice] = Field(default_factory=list)
-    generation_timestamp: float
     model_deployed: str
+    generation_timestamp: float
+    choices: List[StreamingChoice] = field(default_factory=list)
     chunk_type: Literal["chat.completion.chunk"] = "chat.completion.chunk"
     usage: Optional[TokenUsage] = None
-    
-    def __init__(
-        self,
-        chunk_id: str,
-        model_deployed: str,
-        generation_timestamp: float,
-        choices: Optional[List[StreamingChoice]] = None,
-        usage: Optional[TokenUsage] = None,
-        **kwargs
-    ):
-        """Initialize streaming response."""
-        super().__init__(
+
+
+_STREAM_POOL: List[StreamResponse] = []
+"""Reusable StreamResponse instances; see acquire_stream_response()."""
+
+_POOL_LIMIT = 256
+"""Cap so a burst of in-flight chunks cannot grow the pool unboundedly."""
+
+
+def acquire_stream_response(
+    chunk_id: str,
+    model_deployed: str,
+    generation_timestamp: float,
+    choices: Optional[List[StreamingChoice]] = None,
+    chunk_type: Literal["chat.completion.chunk"] = "chat.completion.chunk",
+    usage: Optional[TokenUsage] = None,
+) -> StreamResponse:
+    """
+    Get a StreamResponse from the pool, or construct one.
+
+    Streaming emits one chunk object per token; recycling instances
+    through a pool trades those per-chunk allocations (and the GC churn
+    of freeing them) for plain slot writes. Call
+    release_stream_response() once the chunk has been consumed.
+
+    Args:
+        chunk_id: Unique chunk identifier
+        model_deployed: Model that produced the chunk
+        generation_timestamp: Unix timestamp of generation
+        choices: Streaming choices in the chunk
+        chunk_type: Chunk type tag
+        usage: Token usage, if reported on this chunk
+
+    Returns:
+        A StreamResponse with the given field values
+    """
+    try:
+        # pop() is atomic; catching the empty case instead of checking
+        # first avoids the check-then-act race between streaming threads
+        chunk = _STREAM_POOL.pop()
+    except IndexError:
+        return StreamResponse(
             chunk_id=chunk_id,
-            choices=choices or [],
-            generation_timestamp=generation_timestamp,
             model_deployed=model_deployed,
-            chunk_type="chat.completion.chunk",
+            generation_timestamp=generation_timestamp,
+            choices=choices if choices is not None else [],
+            chunk_type=chunk_type,
             usage=usage,
-            **kwargs
         )
+    chunk.chunk_id = chunk_id
+    chunk.model_deployed = model_deployed
+    chunk.generation_timestamp = generation_timestamp
+    chunk.choices = choices if choices is not None else []
+    chunk.chunk_type = chunk_type
+    chunk.usage = usage
+    return chunk
+
+
+def release_stream_response(chunk: StreamResponse) -> None:
+    """
+    Return a chunk to the pool for reuse.
+
+    The caller must not touch the chunk afterwards — its fields will be
+    overwritten by the next acquire_stream_response().
+
+    Args:
+        chunk: Chunk that is no longer referenced
+    """
+    if len(_STREAM_POOL) < _POOL_LIMIT:
+        chunk.choices = []
+        chunk.usage = None
+        _STREAM_POOL.append(chunk)
+
+
+STREAM_FAST_PATH = True
+"""Streaming fast-path switch.
+
+When True, streaming consumers should decode wire payloads with
+parse_stream_chunk() and pass the resulting TypedDicts through as-is —
+the HTTP layer already validated the schema, so building a
+StreamResponse per chunk only re-checks known-good fields. Model
+objects are materialized on demand via stream_response_to_model().
+"""
+
+_decoder = msgspec.json.Decoder(dict)
+
+
+def parse_stream_chunk(data: bytes | str) -> StreamResponseTypedDict:
+    """
+    Decode one SSE data payload into its TypedDict form.
+
+    One msgspec decode call, no per-field validation and no model
+    construction — the dict is yielded to consumers directly when
+    STREAM_FAST_PATH is on.
+
+    Args:
+        data: Raw JSON bytes (or str) of a single stream chunk
+
+    Returns:
+        The chunk as a StreamResponseTypedDict
+    """
+    return _decoder.decode(data)
+
+
+def stream_response_to_model(payload: StreamResponseTypedDict) -> StreamResponse:
+    """
+    Materialize a StreamResponse from its TypedDict form.
+
+    The lazy counterpart of parse_stream_chunk(): call it only for the
+    chunks user code actually wants as objects.
+
+    Args:
+        payload: Decoded chunk payload
+
+    Returns:
+        Equivalent StreamResponse instance
+    """
+    usage = payload.get("usage")
+    return StreamResponse(
+        chunk_id=payload["chunk_id"],
+        model_deployed=payload["model_deployed"],
+        generation_timestamp=payload["generation_timestamp"],
+        choices=[
+            StreamingChoice(
+                index=choice["index"],
+                delta=choice.get("delta", {}),
+                finish_reason=choice.get("finish_reason"),
+            )
+            for choice in payload.get("choices", ())
+        ],
+        chunk_type=payload.get("chunk_type", "chat.completion.chunk"),
+        usage=TokenUsage(**usage) if usage else None,
+    )
+
+
+@dataclass(slots=True)
+class UsageAccumulator:
+    """
+    Accumulates token counts across stream chunks.
+
+    Plain int slots summed with += instead of one validated TokenUsage
+    per chunk; a single TokenUsage is built at end of stream.
+    """
+
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+
+    def add(self, usage: TokenUsageTypedDict) -> None:
+        """Fold one chunk's usage payload into the running counts."""
+        self.prompt_tokens += usage.get("prompt_tokens", 0)
+        self.completion_tokens += usage.get("completion_tokens", 0)
+        self.cache_read_tokens += usage.get("cache_read_tokens") or 0
+        self.cache_write_tokens += usage.get("cache_write_tokens") or 0
+
+    def to_usage(self) -> TokenUsage:
+        """Build the final TokenUsage once, at end of stream."""
+        return TokenUsage(
+            prompt_tokens=self.prompt_tokens,
+            completion_tokens=self.completion_tokens,
+            cache_read_tokens=self.cache_read_tokens or None,
+            cache_write_tokens=self.cache_write_tokens or None,
+        )
+
+
+def _enc_hook(obj: Any) -> Any:
+    """Dump pydantic values (TokenUsage) msgspec cannot encode natively."""
+    return obj.model_dump()
+
+
+_encoder = msgspec.json.Encoder(enc_hook=_enc_hook)
+
+
+def encode_stream_response(chunk: StreamResponse) -> bytes:
+    """
+    Serialize a streaming chunk straight to JSON bytes.
+
+    msgspec encodes the dataclass directly — no intermediate dict
+    round-trip per chunk.
+
+    Args:
+        chunk: Chunk to serialize
+
+    Returns:
+        UTF-8 JSON bytes
+    """
+    return _encoder.encode(chunk)
@@ -1,10 +1,15 @@
 """Token usage tracking."""
 
 from __future__ import annotations
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Iterable, Optional
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from typing_extensions import TypedDict, NotRequired
 
+try:
+    import numpy as _np
+except ImportError:  # Optional: aggregation falls back to a plain loop
+    _np = None
+
 
 class TokenUsageTypedDict(TypedDict):
     """Type dictionary for token usage."""
@@ -18,28 +23,115 @@ class TokenUsageTypedDict(TypedDict):
 
 class TokenUsage(BaseModel):
     """Tracks token usage for API calls."""
-    
+
+    # Frozen: usage is reported once per response, never edited in
+    # place (UsageAccumulator handles running totals), and freezing
+    # makes the shared EMPTY_USAGE singleton below safe to hand out.
+    model_config = ConfigDict(frozen=True)
+
     prompt_tokens: int = Field(default=0, description="Tokens in prompt")
     completion_tokens: int = Field(default=0, description="Tokens in completion")
     total_tokens: int = Field(default=0, description="Total tokens used")
     cache_read_tokens: Optional[int] = None
     cache_write_tokens: Optional[int] = None
-    
-    def __init__(
-        self,
-        prompt_tokens: int,
-        completion_tokens: int,
-        cache_read_tokens: Optional[int] = None,
-        cache_write_tokens: Optional[int] = None,
-        **kwargs
-    ):
-        """Initialize token usage."""
-        total = prompt_tokens + completion_tokens
-        super().__init__(
-            prompt_tokens=prompt_tokens,
-            completion_tokens=completion_tokens,
-            total_tokens=total,
-            cache_read_tokens=cache_read_tokens,
-            cache_write_tokens=cache_write_tokens,
-            **kwargs
+
+    @model_validator(mode="before")
+    @classmethod
+    def _precompute_total(cls, data):
+        """Sum the total once at construction; reads are then plain field access."""
+        if isinstance(data, dict) and "total_tokens" not in data:
+            data["total_tokens"] = (
+                data.get("prompt_tokens", 0) + data.get("completion_tokens", 0)
+            )
+        return data
+
+    def to_array(self):
+        """
+        Return the counts as a 5-wide int64 numpy array.
+
+        Layout: [prompt, completion, total, cache_read, cache_write],
+        with None cache counts as 0. Requires numpy.
+
+        Returns:
+            np.ndarray of shape (5,), dtype int64
+        """
+        if _np is None:
+            raise ImportError("numpy is required for TokenUsage.to_array")
+        return _np.array(
+            [
+                self.prompt_tokens,
+                self.completion_tokens,
+                self.total_tokens,
+                self.cache_read_tokens or 0,
+                self.cache_write_tokens or 0,
+            ],
+            dtype=_np.int64,
         )
+
+
+EMPTY_USAGE = TokenUsage(prompt_tokens=0, completion_tokens=0)
+"""Shared zero usage for responses that report none.
+
+Intermediate stream chunks and usage-less responses would otherwise
+each construct (and validate) a fresh all-zero TokenUsage; the model is
+frozen, so every call site can return this same instance.
+"""
+
+
+def aggregate_usage(usages: Iterable[TokenUsage]) -> TokenUsage:
+    """
+    Sum token usage across many responses into one TokenUsage.
+
+    With numpy installed, the batch is packed into one (n, 5) int64
+    array and summed with a single C-loop sum(axis=0) — much faster
+    than walking pydantic attributes per instance for billing or log
+    analysis over thousands of responses. Falls back to a plain Python
+    loop otherwise.
+
+    Args:
+        usages: TokenUsage instances to aggregate
+
+    Returns:
+        A TokenUsage holding the column sums (cache counts stay None
+        when no instance reported them)
+    """
+    if _np is not None:
+        rows = [
+            (
+                u.prompt_tokens,
+                u.completion_tokens,
+                u.total_tokens,
+                u.cache_read_tokens or 0,
+                u.cache_write_tokens or 0,
+            )
+            for u in usages
+        ]
+        if not rows:
+            return EMPTY_USAGE
+        sums = _np.array(rows, dtype=_np.int64).sum(axis=0)
+        return TokenUsage(
+            prompt_tokens=int(sums[0]),
+            completion_tokens=int(sums[1]),
+            total_tokens=int(sums[2]),
+            cache_read_tokens=int(sums[3]) or None,
+            cache_write_tokens=int(sums[4]) or None,
+        )
+
+    prompt = completion = total = cache_read = cache_write = 0
+    seen = False
+    for u in usages:
+        seen = True
+        prompt += u.prompt_tokens
+        completion += u.completion_tokens
+        total += u.total_tokens
+        cache_read += u.cache_read_tokens or 0
+        cache_write += u.cache_write_tokens or 0
+    if not seen:
+        return EMPTY_USAGE
+    return TokenUsage(
+        prompt_tokens=prompt,
+        completion_tokens=completion,
+        total_tokens=total,
+        cache_read_tokens=cache_read or None,
+        cache_write_tokens=cache_write or None,
+    )
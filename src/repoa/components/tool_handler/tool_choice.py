@@ -1,30 +1,38 @@
 """Tool choice configuration."""
 
 from __future__ import annotations
-from typing import Optional, Literal, Union
-from pydantic import BaseModel, Field
-from typing_extensions import TypedDict, NotRequired
+from dataclasses import dataclass
+from typing import ClassVar, Optional
 
+_VALID_MODES = frozenset(("auto", "required", "none"))
+"""Allowed tool choice modes, checked once per construction."""
 
-class ToolChoice(BaseModel):
-    """Specifies tool choice behavior."""
-    
-    mode: Literal["auto", "required", "none"] = Field(default="auto")
+
+@dataclass(slots=True, frozen=True)
+class ToolChoice:
+    """
+    Specifies tool choice behavior.
+
+    A frozen slots dataclass rather than a pydantic model: one is built
+    per request that configures tool routing, and a frozenset
+    membership check replaces the Literal validator pass. The common
+    mode="auto" case should reuse the prebuilt ToolChoice.AUTO
+    singleton and allocate nothing.
+    """
+
+    mode: str = "auto"
     preferred_tool: Optional[str] = None
-    
-    class Config:
-        """Pydantic config."""
-        use_enum_values = True
-    
-    def __init__(
-        self,
-        mode: Literal["auto", "required", "none"] = "auto",
-        preferred_tool: Optional[str] = None,
-        **kwargs
-    ):
-        """Initialize tool choice."""
-        super().__init__(
-            mode=mode,
-            preferred_tool=preferred_tool,
-            **kwargs
-        )
+
+    # Shared default instance, assigned after the class body below.
+    AUTO: ClassVar[ToolChoice]
+
+    def __post_init__(self):
+        """Check the mode against the valid set."""
+        if self.mode not in _VALID_MODES:
+            raise ValueError(
+                f"Invalid tool choice mode {self.mode!r}; "
+                f"expected one of {sorted(_VALID_MODES)}"
+            )
+
+
+ToolChoice.AUTO = ToolChoice()
@@ -36,16 +36,3 @@ class ToolDefinition(BaseModel):
     
     type: Literal["function"] = "function"
     function: ToolDefinitionFunction
-    
-    def __init__(
-        self,
-        function: ToolDefinitionFunction,
-        type: Literal["function"] = "function",
-        **kwargs
-    ):
-        """Initialize tool definition."""
-        super().__init__(
-            type=type,
-            function=function,
-            **kwargs
-        )
@@ -40,20 +40,3 @@ class ToolInvocation(BaseModel):
     tool_name: str
     arguments: Dict[str, Any] = Field(default_factory=dict)
     call_timestamp: float
-    
-    def __init__(
-        self,
-        invocation_id: str,
-        tool_name: str,
-        arguments: Dict[str, Any],
-        call_timestamp: float,
-        **kwargs
-    ):
-        """Initialize tool invocation."""
-        super().__init__(
-            invocation_id=invocation_id,
-            tool_name=tool_name,
-            arguments=arguments,
-            call_timestamp=call_timestamp,
-            **kwargs
-        )